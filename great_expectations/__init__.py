@@ -18,6 +18,7 @@ from .util import (
     read_pickle,
     read_table,
     validate,
+    validate_chunked,
 )
 
 # from great_expectations.expectations.core import *
@@ -1168,6 +1168,17 @@ class ExpectationConfiguration(SerializableDictDot):
         # By using the == operator, the returned NotImplemented is handled correctly.
         return not self == other
 
+    def __deepcopy__(self, memo):
+        # Every dataset initialized from an expectation suite deep copies its configurations; copying the attributes
+        # directly skips the generic __reduce_ex__ round trip, which dominates that cost for large suites
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        result.__dict__.update(
+            {key: deepcopy(value, memo) for key, value in self.__dict__.items()}
+        )
+        return result
+
     def __repr__(self):
         return json.dumps(self.to_json_dict())
 
@@ -173,6 +173,14 @@ class DataAsset:
         """
 
         def outer_wrapper(func):
+            # Inspect the signature of the inner wrapper once, rather than on every call of the expectation
+            argspec = inspect.getfullargspec(func)[0][1:]
+            signature_default_kwarg_values = {
+                k: v.default
+                for k, v in inspect.signature(func).parameters.items()
+                if v.default is not inspect.Parameter.empty
+            }
+
             @wraps(func)
             def wrapper(self, *args, **kwargs):
 
@@ -208,9 +216,6 @@ class DataAsset:
                 else:
                     meta = None
 
-                # Get the signature of the inner wrapper:
-                argspec = inspect.getfullargspec(func)[0][1:]
-
                 if "result_format" in argspec:
                     all_args["result_format"] = result_format
                 else:
@@ -246,11 +251,7 @@ class DataAsset:
 
                 # update evaluation_args with defaults from expectation signature
                 if method_name not in ExpectationConfiguration.kwarg_lookup_dict:
-                    default_kwarg_values = {
-                        k: v.default
-                        for k, v in inspect.signature(func).parameters.items()
-                        if v.default is not inspect.Parameter.empty
-                    }
+                    default_kwarg_values = dict(signature_default_kwarg_values)
                     default_kwarg_values.update(evaluation_args)
                     evaluation_args = default_kwarg_values
 
@@ -817,8 +818,6 @@ class DataAsset:
                 # temporarily set self._data_context so it is used inside the expectation decorator
                 self._data_context = data_context
 
-            results = []
-
             if expectation_suite is None:
                 expectation_suite = self.get_expectation_suite(
                     discard_failed_expectations=False,
@@ -908,63 +907,12 @@ class DataAsset:
             for col in columns:
                 expectations_to_evaluate.extend(columns[col])
 
-            for expectation in expectations_to_evaluate:
-
-                try:
-                    # copy the config so we can modify it below if needed
-                    expectation = copy.deepcopy(expectation)
-
-                    expectation_method = getattr(self, expectation.expectation_type)
-
-                    if result_format is not None:
-                        expectation.kwargs.update({"result_format": result_format})
-
-                    # A missing parameter will raise an EvaluationParameterError
-                    (
-                        evaluation_args,
-                        substituted_parameters,
-                    ) = build_evaluation_parameters(
-                        expectation.kwargs,
-                        runtime_evaluation_parameters,
-                        self._config.get("interactive_evaluation", True),
-                        self._data_context,
-                    )
-
-                    result = expectation_method(
-                        catch_exceptions=catch_exceptions,
-                        include_config=True,
-                        **evaluation_args
-                    )
-
-                except Exception as err:
-                    if catch_exceptions:
-                        raised_exception = True
-                        exception_traceback = traceback.format_exc()
-
-                        result = ExpectationValidationResult(
-                            success=False,
-                            exception_info={
-                                "raised_exception": raised_exception,
-                                "exception_traceback": exception_traceback,
-                                "exception_message": str(err),
-                            },
-                        )
-
-                    else:
-                        raise err
-
-                # if include_config:
-                result.expectation_config = expectation
-
-                # Add an empty exception_info object if no exception was caught
-                if catch_exceptions and result.exception_info is None:
-                    result.exception_info = {
-                        "raised_exception": False,
-                        "exception_traceback": None,
-                        "exception_message": None,
-                    }
-
-                results.append(result)
+            results = self._validate_expectations(
+                expectations_to_evaluate,
+                runtime_evaluation_parameters,
+                result_format,
+                catch_exceptions,
+            )
 
             statistics = _calc_validation_statistics(results)
 
@@ -1020,6 +968,78 @@ class DataAsset:
             )
         return result
 
+    def _validate_expectations(
+        self, expectations, evaluation_parameters, result_format, catch_exceptions
+    ):
+        """Evaluate expectations for validate, returning their results in the same order.
+
+        Subclasses may override this to change how expectations are scheduled, for example to evaluate them
+        concurrently.
+        """
+        return [
+            self._validate_expectation(
+                expectation, evaluation_parameters, result_format, catch_exceptions
+            )
+            for expectation in expectations
+        ]
+
+    def _validate_expectation(
+        self, expectation, evaluation_parameters, result_format, catch_exceptions
+    ):
+        """Evaluate a single expectation configuration as part of validate."""
+        try:
+            # copy the config so we can modify it below if needed
+            expectation = copy.deepcopy(expectation)
+
+            expectation_method = getattr(self, expectation.expectation_type)
+
+            if result_format is not None:
+                expectation.kwargs.update({"result_format": result_format})
+
+            # A missing parameter will raise an EvaluationParameterError
+            evaluation_args, substituted_parameters = build_evaluation_parameters(
+                expectation.kwargs,
+                evaluation_parameters,
+                self._config.get("interactive_evaluation", True),
+                self._data_context,
+            )
+
+            result = expectation_method(
+                catch_exceptions=catch_exceptions,
+                include_config=True,
+                **evaluation_args
+            )
+
+        except Exception as err:
+            if catch_exceptions:
+                raised_exception = True
+                exception_traceback = traceback.format_exc()
+
+                result = ExpectationValidationResult(
+                    success=False,
+                    exception_info={
+                        "raised_exception": raised_exception,
+                        "exception_traceback": exception_traceback,
+                        "exception_message": str(err),
+                    },
+                )
+
+            else:
+                raise err
+
+        # if include_config:
+        result.expectation_config = expectation
+
+        # Add an empty exception_info object if no exception was caught
+        if catch_exceptions and result.exception_info is None:
+            result.exception_info = {
+                "raised_exception": False,
+                "exception_traceback": None,
+                "exception_message": None,
+            }
+
+        return result
+
     def get_evaluation_parameter(self, parameter_name, default_value=None):
         """Get an evaluation parameter value that has been stored in meta.
 
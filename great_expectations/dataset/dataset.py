@@ -244,10 +244,11 @@ class Dataset(MetaDataset):
                 setattr(self, func, caching_func)
 
     @classmethod
-    def from_dataset(cls, dataset=None):
+    def from_dataset(cls, dataset=None, **kwargs):
         """This base implementation naively passes arguments on to the real constructor, which
-        is suitable really when a constructor knows to take its own type. In general, this should be overridden"""
-        return cls(dataset)
+        is suitable really when a constructor knows to take its own type. In general, this should be overridden.
+        Any keyword arguments, such as expectation_suite or profiler, are passed on to the constructor"""
+        return cls(dataset, **kwargs)
 
     def get_row_count(self):
         """Returns: int, table row count"""
@@ -748,17 +749,7 @@ class Dataset(MetaDataset):
 
         column_count = self.get_column_count()
 
-        if min_value is not None:
-            above_min = column_count >= min_value
-        else:
-            above_min = True
-
-        if max_value is not None:
-            below_max = column_count <= max_value
-        else:
-            below_max = True
-
-        outcome = above_min and below_max
+        outcome = self._is_between(column_count, min_value, max_value)
 
         return {"success": outcome, "result": {"observed_value": column_count}}
 
@@ -892,17 +883,7 @@ class Dataset(MetaDataset):
 
         row_count = self.get_row_count()
 
-        if min_value is not None:
-            above_min = row_count >= min_value
-        else:
-            above_min = True
-
-        if max_value is not None:
-            below_max = row_count <= max_value
-        else:
-            below_max = True
-
-        outcome = above_min and below_max
+        outcome = self._is_between(row_count, min_value, max_value)
 
         return {"success": outcome, "result": {"observed_value": row_count}}
 
@@ -2683,23 +2664,13 @@ class Dataset(MetaDataset):
         if column_mean is None:
             return {"success": False, "result": {"observed_value": column_mean}}
 
-        if min_value is not None:
-            if strict_min:
-                above_min = column_mean > min_value
-            else:
-                above_min = column_mean >= min_value
-        else:
-            above_min = True
-
-        if max_value is not None:
-            if strict_max:
-                below_max = column_mean < max_value
-            else:
-                below_max = column_mean <= max_value
-        else:
-            below_max = True
-
-        success = above_min and below_max
+        success = self._is_between(
+            column_mean,
+            min_value,
+            max_value,
+            strict_min=strict_min,
+            strict_max=strict_max,
+        )
 
         return {"success": success, "result": {"observed_value": column_mean}}
 
@@ -2787,23 +2758,13 @@ class Dataset(MetaDataset):
         # if strict_max and max_value:
         #     max_value -= tolerance
 
-        if min_value is not None:
-            if strict_min:
-                above_min = column_median > min_value
-            else:
-                above_min = column_median >= min_value
-        else:
-            above_min = True
-
-        if max_value is not None:
-            if strict_max:
-                below_max = column_median < max_value
-            else:
-                below_max = column_median <= max_value
-        else:
-            below_max = True
-
-        success = above_min and below_max
+        success = self._is_between(
+            column_median,
+            min_value,
+            max_value,
+            strict_min=strict_min,
+            strict_max=strict_max,
+        )
 
         return {"success": success, "result": {"observed_value": column_median}}
 
@@ -3028,23 +2989,13 @@ class Dataset(MetaDataset):
         # if strict_max and max_value:
         #     max_value -= tolerance
 
-        if min_value is not None:
-            if strict_min:
-                above_min = column_stdev > min_value
-            else:
-                above_min = column_stdev >= min_value
-        else:
-            above_min = True
-
-        if max_value is not None:
-            if strict_max:
-                below_max = column_stdev < max_value
-            else:
-                below_max = column_stdev <= max_value
-        else:
-            below_max = True
-
-        success = above_min and below_max
+        success = self._is_between(
+            column_stdev,
+            min_value,
+            max_value,
+            strict_min=strict_min,
+            strict_max=strict_max,
+        )
 
         return {"success": success, "result": {"observed_value": column_stdev}}
 
@@ -3116,17 +3067,7 @@ class Dataset(MetaDataset):
         if unique_value_count is None:
             return {"success": False, "result": {"observed_value": unique_value_count}}
 
-        if min_value is not None:
-            above_min = unique_value_count >= min_value
-        else:
-            above_min = True
-
-        if max_value is not None:
-            below_max = unique_value_count <= max_value
-        else:
-            below_max = True
-
-        success = above_min and below_max
+        success = self._is_between(unique_value_count, min_value, max_value)
 
         return {"success": success, "result": {"observed_value": unique_value_count}}
 
@@ -3223,23 +3164,13 @@ class Dataset(MetaDataset):
         #     if max_value:
         #         max_value -= tolerance
 
-        if min_value is not None:
-            if strict_min:
-                above_min = proportion_unique > min_value
-            else:
-                above_min = proportion_unique >= min_value
-        else:
-            above_min = True
-
-        if max_value is not None:
-            if strict_max:
-                below_max = proportion_unique < max_value
-            else:
-                below_max = proportion_unique <= max_value
-        else:
-            below_max = True
-
-        success = above_min and below_max
+        success = self._is_between(
+            proportion_unique,
+            min_value,
+            max_value,
+            strict_min=strict_min,
+            strict_max=strict_max,
+        )
 
         return {"success": success, "result": {"observed_value": proportion_unique}}
 
@@ -3393,23 +3324,13 @@ class Dataset(MetaDataset):
         # if strict_max and max_value:
         #     max_value -= tolerance
 
-        if min_value is not None:
-            if strict_min:
-                above_min = column_sum > min_value
-            else:
-                above_min = column_sum >= min_value
-        else:
-            above_min = True
-
-        if max_value is not None:
-            if strict_max:
-                below_max = column_sum < max_value
-            else:
-                below_max = column_sum <= max_value
-        else:
-            below_max = True
-
-        success = above_min and below_max
+        success = self._is_between(
+            column_sum,
+            min_value,
+            max_value,
+            strict_min=strict_min,
+            strict_max=strict_max,
+        )
 
         return {"success": success, "result": {"observed_value": column_sum}}
 
@@ -3512,35 +3433,25 @@ class Dataset(MetaDataset):
             success = False
         else:
 
-            if min_value is not None:
-                if isinstance(column_min, datetime):
+            if isinstance(column_min, datetime):
+                if min_value is not None:
                     try:
                         min_value = parse(min_value)
                     except (ValueError, TypeError) as e:
                         pass
-
-                if strict_min:
-                    above_min = column_min > min_value
-                else:
-                    above_min = column_min >= min_value
-            else:
-                above_min = True
-
-            if max_value is not None:
-                if isinstance(column_min, datetime):
+                if max_value is not None:
                     try:
                         max_value = parse(max_value)
                     except (ValueError, TypeError) as e:
                         pass
 
-                if strict_max:
-                    below_max = column_min < max_value
-                else:
-                    below_max = column_min <= max_value
-            else:
-                below_max = True
-
-            success = above_min and below_max
+            success = self._is_between(
+                column_min,
+                min_value,
+                max_value,
+                strict_min=strict_min,
+                strict_max=strict_max,
+            )
 
         if parse_strings_as_datetimes:
             if output_strftime_format:
@@ -3643,35 +3554,25 @@ class Dataset(MetaDataset):
         if column_max is None:
             success = False
         else:
-            if min_value is not None:
-                if isinstance(column_max, datetime):
+            if isinstance(column_max, datetime):
+                if min_value is not None:
                     try:
                         min_value = parse(min_value)
                     except (ValueError, TypeError) as e:
                         pass
-
-                if strict_min:
-                    above_min = column_max > min_value
-                else:
-                    above_min = column_max >= min_value
-            else:
-                above_min = True
-
-            if max_value is not None:
-                if isinstance(column_max, datetime):
+                if max_value is not None:
                     try:
                         max_value = parse(max_value)
                     except (ValueError, TypeError) as e:
                         pass
 
-                if strict_max:
-                    below_max = column_max < max_value
-                else:
-                    below_max = column_max <= max_value
-            else:
-                below_max = True
-
-            success = above_min and below_max
+            success = self._is_between(
+                column_max,
+                min_value,
+                max_value,
+                strict_min=strict_min,
+                strict_max=strict_max,
+            )
 
         if parse_strings_as_datetimes:
             if output_strftime_format:
@@ -4775,6 +4676,23 @@ class Dataset(MetaDataset):
         ]
         return parsed_value_set
 
+    @staticmethod
+    def _is_between(
+        value, min_value=None, max_value=None, strict_min=False, strict_max=False
+    ) -> bool:
+        """Check whether value lies between min_value and max_value.
+
+        A bound of None leaves that side unbounded and is never compared against value, so values that cannot be
+        ordered against an infinite sentinel (e.g. strings and datetimes) are supported.
+        """
+        above_min: bool = min_value is None or (
+            value > min_value if strict_min else value >= min_value
+        )
+        below_max: bool = max_value is None or (
+            value < max_value if strict_max else value <= max_value
+        )
+        return above_min and below_max
+
     def attempt_allowing_relative_error(self) -> Union[bool, float]:
         """
         Subclasses can override this method if the respective data source (e.g., Redshift) supports "approximate" mode.
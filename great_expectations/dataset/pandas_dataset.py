@@ -52,6 +52,11 @@ class MetaPandasDataset(Dataset):
         for full documentation of this function.
         """
         argspec = inspect.getfullargspec(func)[0][1:]
+        # Resolved once here rather than on every call of the expectation
+        is_null_expectation: bool = func.__name__ in [
+            "expect_column_values_to_not_be_null",
+            "expect_column_values_to_be_null",
+        ]
 
         @cls.expectation(argspec)
         @wraps(func)
@@ -78,10 +83,7 @@ class MetaPandasDataset(Dataset):
                 data = self
 
             series = data[column]
-            if func.__name__ in [
-                "expect_column_values_to_not_be_null",
-                "expect_column_values_to_be_null",
-            ]:
+            if is_null_expectation:
                 # Counting the number of unexpected values can be expensive when there is a large
                 # number of np.nan values.
                 # This only happens on expect_column_values_to_not_be_null expectations.
@@ -138,10 +140,7 @@ class MetaPandasDataset(Dataset):
             )
 
             # FIXME Temp fix for result format
-            if func.__name__ in [
-                "expect_column_values_to_not_be_null",
-                "expect_column_values_to_be_null",
-            ]:
+            if is_null_expectation:
                 del return_obj["result"]["unexpected_percent_nonmissing"]
                 del return_obj["result"]["missing_count"]
                 del return_obj["result"]["missing_percent"]
@@ -77,6 +77,11 @@ class MetaSparkDFDataset(Dataset):
         for full documentation of this function.
         """
         argspec = inspect.getfullargspec(func)[0][1:]
+        # Resolved once here rather than on every call of the expectation
+        is_null_expectation: bool = func.__name__ in [
+            "expect_column_values_to_not_be_null",
+            "expect_column_values_to_be_null",
+        ]
 
         @cls.expectation(argspec)
         @wraps(func)
@@ -189,10 +194,7 @@ class MetaSparkDFDataset(Dataset):
             )
 
             # FIXME Temp fix for result format
-            if func.__name__ in [
-                "expect_column_values_to_not_be_null",
-                "expect_column_values_to_be_null",
-            ]:
+            if is_null_expectation:
                 del return_obj["result"]["unexpected_percent_nonmissing"]
                 del return_obj["result"]["missing_count"]
                 del return_obj["result"]["missing_percent"]
@@ -599,9 +601,9 @@ class SparkDFDataset(MetaSparkDFDataset):
     """
 
     @classmethod
-    def from_dataset(cls, dataset=None):
+    def from_dataset(cls, dataset=None, **kwargs):
         if isinstance(dataset, SparkDFDataset):
-            return cls(spark_df=dataset.spark_df)
+            return cls(spark_df=dataset.spark_df, **kwargs)
         else:
             raise ValueError("from_dataset requires a SparkDFDataset dataset")
 
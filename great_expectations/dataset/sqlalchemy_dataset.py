@@ -3,9 +3,11 @@ import logging
 import traceback
 import uuid
 import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import wraps
-from typing import Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
@@ -33,12 +35,19 @@ try:
     from sqlalchemy.dialects import registry
     from sqlalchemy.engine import reflection
     from sqlalchemy.engine.default import DefaultDialect
+    from sqlalchemy.engine.interfaces import Compiled
     from sqlalchemy.engine.result import RowProxy
-    from sqlalchemy.exc import ProgrammingError
-    from sqlalchemy.sql.elements import Label, TextClause, WithinGroup, quoted_name
+    from sqlalchemy.exc import ProgrammingError, SQLAlchemyError
+    from sqlalchemy.sql.elements import (
+        ColumnClause,
+        Label,
+        TextClause,
+        WithinGroup,
+        quoted_name,
+    )
     from sqlalchemy.sql.expression import BinaryExpression, literal
     from sqlalchemy.sql.operators import custom_op
-    from sqlalchemy.sql.selectable import CTE, Select
+    from sqlalchemy.sql.selectable import CTE, CompoundSelect, Select
 except ImportError:
     logger.debug(
         "Unable to load SqlAlchemy context; install optional sqlalchemy dependency for support"
@@ -49,12 +58,15 @@ except ImportError:
     BinaryExpression = None
     literal = None
     Select = None
+    CompoundSelect = None
     CTE = None
     custom_op = None
     Label = None
+    ColumnClause = None
     WithinGroup = None
     TextClause = None
     RowProxy = None
+    Compiled = None
     DefaultDialect = None
     ProgrammingError = None
 
@@ -121,6 +133,23 @@ except ImportError:
     pyathena = None
 
 
+# Reflected column metadata, keyed by engine and then by (schema, table_name), shared by datasets created with the
+# cache_reflected_columns batch_kwarg so that they do not pay for reflection round trips each time
+_reflected_columns_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def invalidate_reflection_cache(engine=None):
+    """Discard cached reflected column metadata, e.g. after a table's schema has changed.
+
+    Args:
+        engine: the engine whose cached metadata to discard; if None, discard the cached metadata for all engines
+    """
+    if engine is None:
+        _reflected_columns_cache.clear()
+    else:
+        _reflected_columns_cache.pop(getattr(engine, "engine", engine), None)
+
+
 class SqlAlchemyBatchReference:
     def __init__(self, engine, table_name=None, schema=None, query=None):
         self._engine = engine
@@ -163,14 +192,32 @@ class MetaSqlAlchemyDataset(Dataset):
         object.
         """
         argspec = inspect.getfullargspec(func)[0][1:]
+        # Resolved once here rather than on every call of the expectation
+        is_null_expectation: bool = func.__name__ in [
+            "expect_column_values_to_not_be_null",
+            "expect_column_values_to_be_null",
+        ]
 
         @cls.expectation(argspec)
         @wraps(func)
         def inner_wrapper(
             self, column, mostly=None, result_format=None, *args, **kwargs
         ):
+            try:
+                return evaluate_expectation(
+                    self, column, mostly, result_format, *args, **kwargs
+                )
+            finally:
+                # Value set tables are only needed by the queries of this expectation
+                self._drop_value_set_temp_tables()
+
+        def evaluate_expectation(self, column, mostly, result_format, *args, **kwargs):
             if self.batch_kwargs.get("use_quoted_name"):
                 column = quoted_name(column, quote=True)
+
+            # Building the condition first lets expectations reject invalid arguments before any other work is done
+            expected_condition: BinaryExpression = func(self, column, *args, **kwargs)
+
             if result_format is None:
                 result_format = self.default_expectation_args["result_format"]
 
@@ -184,14 +231,12 @@ class MetaSqlAlchemyDataset(Dataset):
             else:
                 unexpected_count_limit = result_format["partial_unexpected_count"]
 
-            expected_condition: BinaryExpression = func(self, column, *args, **kwargs)
+            # Shared by the ignore values conditions and the unexpected values query built below
+            column_clause: ColumnClause = sa.column(column)
 
             # Added to prepare for when an ignore_values argument is added to the expectation
             ignore_values: list = [None]
-            if func.__name__ in [
-                "expect_column_values_to_not_be_null",
-                "expect_column_values_to_be_null",
-            ]:
+            if is_null_expectation:
                 ignore_values = []
                 # Counting the number of unexpected values can be expensive when there is a large
                 # number of np.nan values.
@@ -208,12 +253,10 @@ class MetaSqlAlchemyDataset(Dataset):
                 and None in ignore_values
             ):
                 ignore_values_conditions += [
-                    sa.column(column).in_(
-                        [val for val in ignore_values if val is not None]
-                    )
+                    column_clause.in_([val for val in ignore_values if val is not None])
                 ]
             if None in ignore_values:
-                ignore_values_conditions += [sa.column(column).is_(None)]
+                ignore_values_conditions += [column_clause.is_(None)]
 
             ignore_values_condition: BinaryExpression
             if len(ignore_values_conditions) > 1:
@@ -225,73 +268,107 @@ class MetaSqlAlchemyDataset(Dataset):
                     sa.literal(False), sa.literal(True), custom_op("=")
                 )
 
-            count_query: Select
-            if self.sql_engine_dialect.name.lower() == "mssql":
-                count_query = self._get_count_query_mssql(
-                    expected_condition=expected_condition,
-                    ignore_values_condition=ignore_values_condition,
-                )
-            else:
-                count_query = self._get_count_query_generic_sqlalchemy(
-                    expected_condition=expected_condition,
-                    ignore_values_condition=ignore_values_condition,
-                )
+            dialect_name: str = self.sql_engine_dialect.name.lower()
+            unexpected_values: list
+            # Without a limit the unexpected values can be arbitrarily many, so stream them from the database (using a
+            # server-side cursor where the driver supports one) instead of buffering the whole result set first
+            unexpected_values_engine = (
+                self.engine.execution_options(stream_results=True)
+                if unexpected_count_limit is None
+                else self.engine
+            )
+            boolean_only: bool = result_format["result_format"] == "BOOLEAN_ONLY"
+            if boolean_only or dialect_name in ["mssql", "mysql"]:
+                # mssql counts through a temporary table, and mysql cannot refer to a temporary table more than once
+                # in the same query, so these dialects retrieve counts and unexpected values in separate queries.
+                # BOOLEAN_ONLY only needs the counts to compute success, so it skips the unexpected values query.
+                count_query: Select
+                if dialect_name == "mssql":
+                    count_query = self._get_count_query_mssql(
+                        expected_condition=expected_condition,
+                        ignore_values_condition=ignore_values_condition,
+                    )
+                else:
+                    count_query = self._get_count_query_generic_sqlalchemy(
+                        expected_condition=expected_condition,
+                        ignore_values_condition=ignore_values_condition,
+                    )
 
-            count_results: dict = dict(self.engine.execute(count_query).fetchone())
+                element_count, null_count, unexpected_count = self.engine.execute(
+                    count_query
+                ).fetchone()
 
-            # Handle case of empty table gracefully:
-            if (
-                "element_count" not in count_results
-                or count_results["element_count"] is None
-            ):
-                count_results["element_count"] = 0
-            if "null_count" not in count_results or count_results["null_count"] is None:
-                count_results["null_count"] = 0
-            if (
-                "unexpected_count" not in count_results
-                or count_results["unexpected_count"] is None
-            ):
-                count_results["unexpected_count"] = 0
+                if boolean_only:
+                    unexpected_values = []
+                else:
+                    # Retrieve unexpected values
+                    unexpected_query_results = unexpected_values_engine.execute(
+                        sa.select([column_clause])
+                        .select_from(self._table)
+                        .where(
+                            sa.and_(
+                                sa.not_(expected_condition),
+                                sa.not_(ignore_values_condition),
+                            )
+                        )
+                        .limit(unexpected_count_limit)
+                    )
+                    unexpected_values = [x[0] for x in unexpected_query_results]
+            else:
+                # Retrieve counts and unexpected values in a single round trip
+                count_and_unexpected_query: CompoundSelect = (
+                    self._get_count_and_unexpected_values_query(
+                        column=column_clause,
+                        expected_condition=expected_condition,
+                        ignore_values_condition=ignore_values_condition,
+                        unexpected_count_limit=unexpected_count_limit,
+                    )
+                )
+                element_count = null_count = unexpected_count = None
+                unexpected_values = []
+                for (
+                    row_type,
+                    row_element_count,
+                    row_null_count,
+                    row_unexpected_count,
+                    unexpected_value,
+                ) in unexpected_values_engine.execute(count_and_unexpected_query):
+                    if row_type == 0:
+                        element_count = row_element_count
+                        null_count = row_null_count
+                        unexpected_count = row_unexpected_count
+                    else:
+                        unexpected_values.append(unexpected_value)
 
+            # Handle case of empty table gracefully, where sums are NULL.
             # Some engines may return Decimal from count queries (lookin' at you MSSQL)
             # Convert to integers
-            count_results["element_count"] = int(count_results["element_count"])
-            count_results["null_count"] = int(count_results["null_count"])
-            count_results["unexpected_count"] = int(count_results["unexpected_count"])
+            element_count = int(element_count or 0)
+            null_count = int(null_count or 0)
+            unexpected_count = int(unexpected_count or 0)
 
-            # Retrieve unexpected values
-            unexpected_query_results = self.engine.execute(
-                sa.select([sa.column(column)])
-                .select_from(self._table)
-                .where(
-                    sa.and_(
-                        sa.not_(expected_condition), sa.not_(ignore_values_condition)
-                    )
-                )
-                .limit(unexpected_count_limit)
-            )
+            if ignore_values == [None]:
+                # With the default ignore_values, the counts are the column's element and null counts, so they can be
+                # reused by subsequent expectations on the same column.
+                self._cache_column_counts(column, element_count, null_count)
 
-            nonnull_count: int = (
-                count_results["element_count"] - count_results["null_count"]
-            )
+            nonnull_count: int = element_count - null_count
 
             if "output_strftime_format" in kwargs:
                 output_strftime_format = kwargs["output_strftime_format"]
                 maybe_limited_unexpected_list = []
-                for x in unexpected_query_results.fetchall():
-                    if isinstance(x[column], str):
-                        col = parse(x[column])
+                for x in unexpected_values:
+                    if isinstance(x, str):
+                        col = parse(x)
                     else:
-                        col = x[column]
+                        col = x
                     maybe_limited_unexpected_list.append(
                         datetime.strftime(col, output_strftime_format)
                     )
             else:
-                maybe_limited_unexpected_list = [
-                    x[column] for x in unexpected_query_results.fetchall()
-                ]
+                maybe_limited_unexpected_list = unexpected_values
 
-            success_count = nonnull_count - count_results["unexpected_count"]
+            success_count = nonnull_count - unexpected_count
             success, percent_success = self._calc_map_expectation_success(
                 success_count, nonnull_count, mostly
             )
@@ -299,17 +376,14 @@ class MetaSqlAlchemyDataset(Dataset):
             return_obj = self._format_map_output(
                 result_format,
                 success,
-                count_results["element_count"],
+                element_count,
                 nonnull_count,
-                count_results["unexpected_count"],
+                unexpected_count,
                 maybe_limited_unexpected_list,
                 None,
             )
 
-            if func.__name__ in [
-                "expect_column_values_to_not_be_null",
-                "expect_column_values_to_be_null",
-            ]:
+            if is_null_expectation:
                 # These results are unnecessary for the above expectations
                 del return_obj["result"]["unexpected_percent_nonmissing"]
                 del return_obj["result"]["missing_count"]
@@ -368,9 +442,7 @@ class MetaSqlAlchemyDataset(Dataset):
             sa.select(
                 [
                     sa.func.count().label("element_count"),
-                    sa.func.sum(sa.case([(ignore_values_condition, 1)], else_=0)).label(
-                        "null_count"
-                    ),
+                    self._count_where(ignore_values_condition).label("null_count"),
                 ]
             )
             .select_from(self._table)
@@ -405,26 +477,95 @@ class MetaSqlAlchemyDataset(Dataset):
         return sa.select(
             [
                 sa.func.count().label("element_count"),
-                sa.func.sum(sa.case([(ignore_values_condition, 1)], else_=0)).label(
-                    "null_count"
-                ),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    sa.not_(expected_condition),
-                                    sa.not_(ignore_values_condition),
-                                ),
-                                1,
-                            )
-                        ],
-                        else_=0,
+                self._count_where(ignore_values_condition).label("null_count"),
+                self._count_where(
+                    sa.and_(
+                        sa.not_(expected_condition), sa.not_(ignore_values_condition)
                     )
                 ).label("unexpected_count"),
             ]
         ).select_from(self._table)
 
+    def _get_count_and_unexpected_values_query(
+        self,
+        column: ColumnClause,
+        expected_condition: BinaryExpression,
+        ignore_values_condition: BinaryExpression,
+        unexpected_count_limit: int = None,
+    ) -> CompoundSelect:
+        """Combine the count query and the (limited) unexpected values query into a single statement.
+
+        Rows are first tagged as ignored and/or unexpected in a common table expression, so the conditions are
+        evaluated once per row and both the counts and the unexpected values sample are read from the same tagged
+        rows.
+
+        The first column of each returned row discriminates between the two halves: the row with row_type 0 holds
+        element_count, null_count and unexpected_count, and every row with row_type 1 holds one unexpected value in
+        its last column. Unused columns are padded with NULL so both halves share a schema.
+        """
+        unexpected_condition: BinaryExpression = sa.and_(
+            sa.not_(expected_condition), sa.not_(ignore_values_condition)
+        )
+
+        # Where the dialect counts booleans natively (see _count_where) the tags are the conditions themselves,
+        # otherwise they are 1/0 flags to be summed
+        boolean_tags: bool = self._counts_booleans_natively()
+
+        def tag(condition):
+            return condition if boolean_tags else sa.case([(condition, 1)], else_=0)
+
+        def count_tagged(tag_column):
+            return (
+                self._count_where(tag_column)
+                if boolean_tags
+                else sa.func.sum(tag_column)
+            )
+
+        tagged_rows: CTE = (
+            sa.select(
+                [
+                    column.label("value"),
+                    tag(ignore_values_condition).label("is_ignored"),
+                    tag(unexpected_condition).label("is_unexpected"),
+                ]
+            )
+            .select_from(self._table)
+            .cte("TaggedRows")
+        )
+
+        count_query: Select = sa.select(
+            [
+                sa.literal_column("0").label("row_type"),
+                sa.func.count().label("element_count"),
+                count_tagged(tagged_rows.c.is_ignored).label("null_count"),
+                count_tagged(tagged_rows.c.is_unexpected).label("unexpected_count"),
+                sa.null().label("unexpected_value"),
+            ]
+        ).select_from(tagged_rows)
+
+        unexpected_values_subquery = (
+            sa.select([tagged_rows.c.value.label("unexpected_value")])
+            .select_from(tagged_rows)
+            .where(
+                tagged_rows.c.is_unexpected
+                if boolean_tags
+                else tagged_rows.c.is_unexpected == 1
+            )
+            .limit(unexpected_count_limit)
+            .alias("UnexpectedValuesSubquery")
+        )
+        unexpected_values_query: Select = sa.select(
+            [
+                sa.literal_column("1").label("row_type"),
+                sa.null().label("element_count"),
+                sa.null().label("null_count"),
+                sa.null().label("unexpected_count"),
+                unexpected_values_subquery.c.unexpected_value,
+            ]
+        ).select_from(unexpected_values_subquery)
+
+        return sa.union_all(count_query, unexpected_values_query)
+
 
 class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     """
@@ -449,10 +590,33 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
 
     --ge-feature-maturity-info--"""
 
+    # value_sets at least this large are loaded into a temporary table and matched with a subquery instead of being
+    # inlined into an IN (...) list, on dialects listed in value_set_temp_table_dialects when the dataset runs all of
+    # its queries on a single Connection
+    value_set_temp_table_min_size = 1000
+    value_set_temp_table_dialects = ["postgresql", "sqlite"]
+    # validate prefetches the aggregates checked by these expectations in a single query, see
+    # prefetch_column_aggregates
+    prefetched_aggregate_expectation_types = [
+        "expect_column_min_to_be_between",
+        "expect_column_max_to_be_between",
+        "expect_column_sum_to_be_between",
+        "expect_column_mean_to_be_between",
+    ]
+    # validate may evaluate expectations concurrently on these dialects, where every worker thread checks out its own
+    # pooled connection and the database serves the sessions in parallel
+    parallel_validation_dialects = ["postgresql", "redshift", "bigquery"]
+    # Conditional counts use the dialect's COUNT_IF aggregate where one exists, or sum the condition cast to an integer
+    # on dialects listed in boolean_cast_count_dialects, instead of summing a CASE expression; see _count_where
+    count_if_functions = {"snowflake": "count_if", "bigquery": "countif"}
+    boolean_cast_count_dialects = ["postgresql"]
+
     @classmethod
-    def from_dataset(cls, dataset=None):
+    def from_dataset(cls, dataset=None, **kwargs):
         if isinstance(dataset, SqlAlchemyDataset):
-            return cls(table_name=str(dataset._table.name), engine=dataset.engine)
+            return cls(
+                table_name=str(dataset._table.name), engine=dataset.engine, **kwargs
+            )
         else:
             raise ValueError("from_dataset requires a SqlAlchemy dataset")
 
@@ -586,8 +750,13 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                     )
 
         try:
-            insp = reflection.Inspector.from_engine(self.engine)
-            self.columns = insp.get_columns(table_name, schema=schema)
+            self.columns = self._reflect_columns(
+                table_name,
+                schema=schema,
+                use_cache=(kwargs.get("batch_kwargs") or {}).get(
+                    "cache_reflected_columns", False
+                ),
+            )
         except KeyError:
             # we will get a KeyError for temporary tables, since
             # reflection will not find the temporary schema
@@ -597,6 +766,45 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         if len(self.columns) == 0:
             self.columns = self.column_reflection_fallback()
 
+        self._columns_by_name: Dict[str, dict] = {
+            col["name"]: col for col in self.columns
+        }
+        # Columns whose reflected type is numeric; columns reflected without type information are never included
+        self._numeric_columns: Set[str] = {
+            col["name"]
+            for col in self.columns
+            if isinstance(col.get("type"), (sa.types.Integer, sa.types.Numeric))
+        }
+        # Columns whose reflected type supports MIN and MAX on every dialect; boolean, json or uuid columns, for
+        # instance, cannot be ordered on postgresql
+        self._orderable_columns: Set[str] = {
+            col["name"]
+            for col in self.columns
+            if isinstance(
+                col.get("type"),
+                (
+                    sa.types.Integer,
+                    sa.types.Numeric,
+                    sa.types.String,
+                    sa.types.Date,
+                    sa.types.DateTime,
+                    sa.types.Time,
+                ),
+            )
+        }
+
+        # Element and null counts per column, shared across expectations when caching is enabled
+        self._column_counts_cache: Dict[str, Tuple[int, int]] = {}
+        # Column aggregates keyed by (aggregate, column), populated by prefetch_column_aggregates
+        self._column_aggregates_cache: Dict[Tuple[str, str], Any] = {}
+        # Compiled metric statements, see _execute_compiled_statement
+        self._compiled_statements: Dict[Tuple, Compiled] = {}
+        # Set by validate, see _validate_expectations
+        self._validation_max_workers: int = 1
+        self._validating_concurrently: bool = False
+        # Temporary tables created by _get_value_set_clause for the expectation being evaluated
+        self._value_set_temp_tables: List[sa.Table] = []
+
         # Only call super once connection is established and table_name and columns known to allow autoinspection
         super().__init__(*args, **kwargs)
 
@@ -604,6 +812,30 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     def sql_engine_dialect(self) -> DefaultDialect:
         return self.engine.dialect
 
+    def _reflect_columns(self, table_name, schema=None, use_cache=False) -> List[Dict]:
+        """Reflect the columns of a table.
+
+        With use_cache, metadata already reflected through the same engine is reused until invalidate_reflection_cache
+        is called, so schema changes made in the meantime are not seen. Tables generated from custom_sql are always
+        reflected, since their names are unique to this dataset.
+        """
+        if not use_cache or self.generated_table_name is not None:
+            insp = reflection.Inspector.from_engine(self.engine)
+            return insp.get_columns(table_name, schema=schema)
+
+        # sqlite/mssql/snowflake datasets hold a Connection; cache on its underlying Engine
+        engine = getattr(self.engine, "engine", self.engine)
+        engine_cache: dict = _reflected_columns_cache.setdefault(engine, {})
+        key: Tuple[str, str] = (schema, table_name)
+        if key not in engine_cache:
+            insp = reflection.Inspector.from_engine(self.engine)
+            columns = insp.get_columns(table_name, schema=schema)
+            if len(columns) == 0:
+                # Nothing to cache; the caller falls back to a query-based reflection
+                return columns
+            engine_cache[key] = columns
+        return list(engine_cache[key])
+
     def attempt_allowing_relative_error(self):
         detected_redshift: bool = sqlalchemy_redshift is not None and check_sql_engine_dialect(
             actual_sql_engine_dialect=self.sql_engine_dialect,
@@ -664,13 +896,179 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             ),
         )
 
+    def validate(self, *args, max_workers=None, **kwargs):
+        """Validate the dataset as DataAsset.validate does, optionally evaluating expectations concurrently.
+
+        Args:
+            max_workers (int or None): \
+                The number of threads evaluating expectations. Each thread runs its queries on its own connection \
+                from the engine's pool, so the pool_size the engine was created with bounds the useful value. \
+                If None, the validation_max_workers batch_kwarg is used, and expectations are otherwise evaluated \
+                one at a time.
+
+        All other arguments are passed to DataAsset.validate.
+
+        Notes:
+            Expectations are only evaluated concurrently on dialects listed in parallel_validation_dialects, and not
+            for datasets built from custom_sql, whose temporary table is visible to a single connection only.
+        """
+        if max_workers is None:
+            max_workers = self.batch_kwargs.get("validation_max_workers")
+        self._validation_max_workers = max_workers or 1
+        try:
+            return super().validate(*args, **kwargs)
+        finally:
+            self._validation_max_workers = 1
+
+    def _validate_expectations(
+        self, expectations, evaluation_parameters, result_format, catch_exceptions
+    ):
+        self._prefetch_validation_aggregates(expectations)
+        if not (
+            self._validation_max_workers > 1
+            and len(expectations) > 1
+            and isinstance(self.engine, sa.engine.Engine)
+            and self.engine.dialect.name.lower() in self.parallel_validation_dialects
+            and self.generated_table_name is None
+        ):
+            return super()._validate_expectations(
+                expectations, evaluation_parameters, result_format, catch_exceptions
+            )
+
+        self._validating_concurrently = True
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self._validation_max_workers
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._validate_expectation,
+                        expectation,
+                        evaluation_parameters,
+                        result_format,
+                        catch_exceptions,
+                    )
+                    for expectation in expectations
+                ]
+                return [future.result() for future in futures]
+        finally:
+            self._validating_concurrently = False
+
+    def _prefetch_validation_aggregates(self, expectations):
+        """Prefetch the aggregates of the columns checked by the column aggregate expectations about to be
+        validated, when there is more than one such expectation to share the query."""
+        columns: List[str] = []
+        aggregate_expectation_count: int = 0
+        for expectation in expectations:
+            if (
+                expectation.expectation_type
+                not in self.prefetched_aggregate_expectation_types
+            ):
+                continue
+            column = expectation.kwargs.get("column")
+            if not isinstance(column, str):
+                continue
+            aggregate_expectation_count += 1
+            if column not in columns:
+                columns.append(column)
+        if aggregate_expectation_count > 1:
+            self.prefetch_column_aggregates(columns)
+
     def get_row_count(self, table_name=None):
         if table_name is None:
-            table_name = self._table
+            if self.caching and self._column_counts_cache:
+                element_count, _ = next(iter(self._column_counts_cache.values()))
+                return element_count
+            if self.batch_kwargs.get("use_table_statistics_for_row_count"):
+                row_count = self._get_row_count_from_table_statistics()
+                if row_count is not None:
+                    return row_count
+        # The table expression is only built the first time the row count statement is compiled
+        return int(
+            self._execute_compiled_statement(
+                ("row_count", table_name),
+                lambda: sa.select([sa.func.count()]).select_from(
+                    self._table if table_name is None else sa.table(table_name)
+                ),
+            ).scalar()
+        )
+
+    def _execute_compiled_statement(self, key: Tuple, build_statement):
+        """Execute a statement that is fully determined by key, compiling it only the first time it is requested.
+
+        Metric queries such as counts and column aggregates are issued repeatedly with the same shape when caching is
+        disabled or the cached values are invalidated, so their SQL compilation is reused rather than repeated.
+        """
+        # A quoted_name compares equal to the str it wraps, but may compile to a differently quoted identifier
+        key = tuple(
+            (part, part.quote) if isinstance(part, quoted_name) else part
+            for part in key
+        )
+        compiled: Compiled = self._compiled_statements.get(key)
+        if compiled is None:
+            compiled = build_statement().compile(dialect=self.sql_engine_dialect)
+            self._compiled_statements[key] = compiled
+        return self.engine.execute(compiled)
+
+    def _get_row_count_from_table_statistics(self) -> Optional[int]:
+        """Read the table row count from the database catalog instead of scanning the table.
+
+        Catalog statistics may be stale or approximate (e.g. postgresql's reltuples is only refreshed by ANALYZE and
+        VACUUM), so this is only used when requested with the use_table_statistics_for_row_count batch_kwarg.
+
+        Returns:
+            The row count, or None if the dialect does not expose one for this table.
+        """
+        if self.generated_table_name is not None:
+            # Temporary tables created from custom_sql have no collected statistics
+            return None
+
+        dialect_name: str = self.sql_engine_dialect.name.lower()
+        statistics_query: TextClause
+        params: dict = {"table_name": self._table.name}
+        if dialect_name in ["postgresql", "redshift"]:
+            statistics_query = sa.text(
+                "SELECT c.reltuples FROM pg_class c "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE c.relname = :table_name AND n.nspname = COALESCE(:schema, current_schema())"
+            )
+            params["schema"] = self._table.schema
+        elif dialect_name == "snowflake":
+            statistics_query = sa.text(
+                "SELECT row_count FROM information_schema.tables "
+                "WHERE UPPER(table_name) = UPPER(:table_name) "
+                "AND UPPER(table_schema) = UPPER(COALESCE(:schema, CURRENT_SCHEMA()))"
+            )
+            params["schema"] = self._table.schema
+        elif dialect_name == "bigquery":
+            # In BigQuery the table name is already qualified with its dataset, if any; older pybigquery dialects have
+            # no dataset_id attribute, in which case the row count falls back to COUNT
+            dataset_id, _, table_id = self._table.name.rpartition(".")
+            dataset_id = dataset_id or getattr(
+                self.sql_engine_dialect, "dataset_id", None
+            )
+            if not dataset_id:
+                return None
+            statistics_query = sa.text(
+                f"SELECT row_count FROM `{dataset_id}.__TABLES__` WHERE table_id = :table_name"
+            )
+            params["table_name"] = table_id
         else:
-            table_name = sa.table(table_name)
-        count_query = sa.select([sa.func.count()]).select_from(table_name)
-        return int(self.engine.execute(count_query).scalar())
+            return None
+
+        try:
+            row_count = self.engine.execute(statistics_query, params).scalar()
+        except Exception as e:
+            logger.debug(
+                f"Unable to read row count from table statistics; falling back to COUNT: {e}"
+            )
+            return None
+
+        # postgresql reports -1 (or 0 before version 14) for tables that have never been analyzed, so a
+        # non-positive statistic is not trusted; counting an empty table is cheap anyway
+        if row_count is None or row_count <= 0:
+            return None
+        return int(row_count)
 
     def get_column_count(self):
         return len(self.columns)
@@ -679,59 +1077,139 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return [col["name"] for col in self.columns]
 
     def get_column_nonnull_count(self, column):
-        ignore_values = [None]
-        count_query = sa.select(
-            [
-                sa.func.count().label("element_count"),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.or_(
-                                    sa.column(column).in_(ignore_values),
-                                    # Below is necessary b/c sa.in_() uses `==` but None != None
-                                    # But we only consider this if None is actually in the list of ignore values
-                                    sa.column(column).is_(None)
-                                    if None in ignore_values
-                                    else False,
-                                ),
-                                1,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("null_count"),
-            ]
-        ).select_from(self._table)
-        count_results = dict(self.engine.execute(count_query).fetchone())
-        element_count = int(count_results.get("element_count") or 0)
-        null_count = int(count_results.get("null_count") or 0)
+        element_count, null_count = self._get_column_counts(column)
         return element_count - null_count
 
-    def get_column_sum(self, column):
+    def _get_column_counts(self, column) -> Tuple[int, int]:
+        """Return the (element_count, null_count) pair for a column, reusing cached counts when available."""
+        if self.caching and column in self._column_counts_cache:
+            return self._column_counts_cache[column]
+
+        ignore_values = [None]
+        element_count, null_count = self._execute_compiled_statement(
+            ("column_counts", column),
+            lambda: sa.select(
+                [
+                    sa.func.count().label("element_count"),
+                    self._count_where(
+                        sa.or_(
+                            sa.column(column).in_(ignore_values),
+                            # Below is necessary b/c sa.in_() uses `==` but None != None
+                            # But we only consider this if None is actually in the list of ignore values
+                            sa.column(column).is_(None)
+                            if None in ignore_values
+                            else False,
+                        )
+                    ).label("null_count"),
+                ]
+            ).select_from(self._table),
+        ).fetchone()
+        element_count = int(element_count or 0)
+        null_count = int(null_count or 0)
+        self._cache_column_counts(column, element_count, null_count)
+        return element_count, null_count
+
+    def _cache_column_counts(self, column, element_count: int, null_count: int):
+        if self.caching:
+            self._column_counts_cache[column] = (element_count, null_count)
+
+    def invalidate_column_counts(self):
+        """Discard cached row, element and null counts and column aggregates, e.g. after the underlying table has
+        been modified."""
+        self._column_counts_cache.clear()
+        self._column_aggregates_cache.clear()
+        if self.caching:
+            for func in [
+                "get_row_count",
+                "get_column_nonnull_count",
+                "get_column_sum",
+                "get_column_max",
+                "get_column_min",
+                "get_column_mean",
+            ]:
+                getattr(self, func).cache_clear()
+
+    def prefetch_column_aggregates(self, columns: Optional[List[str]] = None):
+        """Compute the element and null counts, min, max, sum and mean of several columns in a single query.
+
+        The results are reused by get_row_count, get_column_nonnull_count, get_column_min, get_column_max,
+        get_column_sum and get_column_mean, so that a suite of column aggregate expectations scans the table once
+        rather than several times per expectation. validate prefetches the columns of the min, max, sum and mean
+        expectations it evaluates. Min and max are only computed for columns whose reflected type is orderable, and
+        sum and mean for columns whose reflected type is numeric; columns that are not reflected are skipped. If the
+        query fails, nothing is cached and each aggregate is queried on its own when it is needed. Has no effect
+        unless caching is enabled.
+
+        Args:
+            columns (list or None): the columns to compute aggregates for; defaults to all columns of the table
+        """
+        if not self.caching:
+            return
+
+        if columns is None:
+            columns = self.get_table_columns()
+
+        selects: List[Label] = [sa.func.count().label("element_count")]
+        keys: List[Tuple[str, str]] = []
+        for column in columns:
+            if column not in self._columns_by_name:
+                continue
+            aggregates = {
+                "null_count": self._count_where(sa.column(column).is_(None)),
+            }
+            if column in self._orderable_columns:
+                aggregates["min"] = sa.func.min(sa.column(column))
+                aggregates["max"] = sa.func.max(sa.column(column))
+            if column in self._numeric_columns:
+                aggregates["sum"] = sa.func.sum(sa.column(column))
+                # column * 1.0 needed for correct calculation of avg in MSSQL
+                aggregates["mean"] = sa.func.avg(sa.column(column) * 1.0)
+            for aggregate, expression in aggregates.items():
+                selects.append(expression.label(f"{aggregate}_{len(keys)}"))
+                keys.append((aggregate, column))
+
+        if len(keys) == 0:
+            return
+        try:
+            results = self.engine.execute(
+                sa.select(selects).select_from(self._table)
+            ).fetchone()
+        except SQLAlchemyError as e:
+            logger.debug(
+                f"Prefetching column aggregates failed, computing them one at a time instead: {e}"
+            )
+            return
+        element_count = int(results[0] or 0)
+        for (aggregate, column), value in zip(keys, results[1:]):
+            if aggregate == "null_count":
+                self._cache_column_counts(column, element_count, int(value or 0))
+            else:
+                self._column_aggregates_cache[
+                    (aggregate, column)
+                ] = convert_to_json_serializable(value)
+
+    def _get_column_aggregate(self, aggregate: str, column, expression):
+        if (aggregate, column) in self._column_aggregates_cache:
+            return self._column_aggregates_cache[(aggregate, column)]
         return convert_to_json_serializable(
-            self.engine.execute(
-                sa.select([sa.func.sum(sa.column(column))]).select_from(self._table)
+            self._execute_compiled_statement(
+                (aggregate, column),
+                lambda: sa.select([expression]).select_from(self._table),
             ).scalar()
         )
 
+    def get_column_sum(self, column):
+        return self._get_column_aggregate("sum", column, sa.func.sum(sa.column(column)))
+
     def get_column_max(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
-        return convert_to_json_serializable(
-            self.engine.execute(
-                sa.select([sa.func.max(sa.column(column))]).select_from(self._table)
-            ).scalar()
-        )
+        return self._get_column_aggregate("max", column, sa.func.max(sa.column(column)))
 
     def get_column_min(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
-        return convert_to_json_serializable(
-            self.engine.execute(
-                sa.select([sa.func.min(sa.column(column))]).select_from(self._table)
-            ).scalar()
-        )
+        return self._get_column_aggregate("min", column, sa.func.min(sa.column(column)))
 
     def get_column_value_counts(self, column, sort="value", collate=None):
         if sort not in ["value", "count", "none"]:
@@ -768,20 +1246,17 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
 
     def get_column_mean(self, column):
         # column * 1.0 needed for correct calculation of avg in MSSQL
-        return convert_to_json_serializable(
-            self.engine.execute(
-                sa.select([sa.func.avg(sa.column(column) * 1.0)]).select_from(
-                    self._table
-                )
-            ).scalar()
+        return self._get_column_aggregate(
+            "mean", column, sa.func.avg(sa.column(column) * 1.0)
         )
 
     def get_column_unique_count(self, column):
         return convert_to_json_serializable(
-            self.engine.execute(
-                sa.select(
+            self._execute_compiled_statement(
+                ("unique_count", column),
+                lambda: sa.select(
                     [sa.func.count(sa.func.distinct(sa.column(column)))]
-                ).select_from(self._table)
+                ).select_from(self._table),
             ).scalar()
         )
 
@@ -1423,7 +1898,9 @@ WHERE
         meta=None,
     ):
         columns = [
-            sa.column(col["name"]) for col in self.columns if col["name"] in column_list
+            sa.column(col_name)
+            for col_name in column_list
+            if col_name in self._columns_by_name
         ]
         query = (
             sa.select([sa.func.count()])
@@ -1549,11 +2026,10 @@ WHERE
                 "SqlAlchemyDataset does not support column map semantics for column types"
             )
 
-        try:
-            col_data = [col for col in self.columns if col["name"] == column][0]
-            col_type = type(col_data["type"])
-        except IndexError:
+        if column not in self._columns_by_name:
             raise ValueError("Unrecognized column: %s" % column)
+        try:
+            col_type = type(self._columns_by_name[column]["type"])
         except KeyError:
             raise ValueError("No database type data available for column: %s" % column)
 
@@ -1596,11 +2072,10 @@ WHERE
                 "SqlAlchemyDataset does not support column map semantics for column types"
             )
 
-        try:
-            col_data = [col for col in self.columns if col["name"] == column][0]
-            col_type = type(col_data["type"])
-        except IndexError:
+        if column not in self._columns_by_name:
             raise ValueError("Unrecognized column: %s" % column)
+        try:
+            col_type = type(self._columns_by_name[column]["type"])
         except KeyError:
             raise ValueError("No database type data available for column: %s" % column)
 
@@ -1654,7 +2129,9 @@ WHERE
             parsed_value_set = self._parse_value_set(value_set)
         else:
             parsed_value_set = value_set
-        return sa.column(column).in_(tuple(parsed_value_set))
+        return sa.column(column).in_(
+            self._get_value_set_clause(column, parsed_value_set)
+        )
 
     @DocInherit
     @MetaSqlAlchemyDataset.column_map_expectation
@@ -1673,7 +2150,86 @@ WHERE
             parsed_value_set = self._parse_value_set(value_set)
         else:
             parsed_value_set = value_set
-        return sa.column(column).notin_(tuple(parsed_value_set))
+        return sa.column(column).notin_(
+            self._get_value_set_clause(column, parsed_value_set)
+        )
+
+    def _counts_booleans_natively(self) -> bool:
+        dialect_name: str = self.sql_engine_dialect.name.lower()
+        return (
+            dialect_name in self.count_if_functions
+            or dialect_name in self.boolean_cast_count_dialects
+        )
+
+    def _count_where(self, condition):
+        """Return an aggregate counting the rows for which condition is true.
+
+        SUM(CASE WHEN condition THEN 1 ELSE 0 END) works everywhere, but dialects with a native conditional count or
+        a boolean to integer cast evaluate those forms with less per-row overhead. Callers treat a NULL count as 0.
+        """
+        dialect_name: str = self.sql_engine_dialect.name.lower()
+        if dialect_name in self.count_if_functions:
+            return getattr(sa.func, self.count_if_functions[dialect_name])(condition)
+        if dialect_name in self.boolean_cast_count_dialects:
+            return sa.func.sum(sa.cast(condition, sa.Integer))
+        return sa.func.sum(sa.case([(condition, 1)], else_=0))
+
+    def _get_value_set_clause(self, column, value_set):
+        """Return the right-hand side of an IN comparison against value_set.
+
+        Large value sets inlined into IN (...) make statements slow to parse and plan, so on supported dialects they
+        are instead inserted into a temporary table and matched with a subquery, which the database can evaluate
+        with a hash lookup. The table is dropped once the calling expectation has been evaluated.
+        """
+        if (
+            # a temporary table is only visible to the connection that created it, so every statement that refers
+            # to it has to run on the same connection rather than on whichever one a pooled Engine checks out
+            not isinstance(self.engine, sa.engine.Connection)
+            or self._validating_concurrently
+            or len(value_set) < self.value_set_temp_table_min_size
+            or self.sql_engine_dialect.name.lower()
+            not in self.value_set_temp_table_dialects
+        ):
+            return tuple(value_set)
+        value_type = self._get_value_set_temp_table_type(column, value_set)
+        if value_type is None:
+            return tuple(value_set)
+
+        temp_table_name: str = f"ge_tmp_{str(uuid.uuid4())[:8]}"
+        temp_table_obj: sa.Table = sa.Table(
+            temp_table_name,
+            sa.MetaData(),
+            sa.Column("value", value_type),
+            prefixes=["TEMPORARY"],
+        )
+        temp_table_obj.create(self.engine)
+        self._value_set_temp_tables.append(temp_table_obj)
+        self.engine.execute(
+            temp_table_obj.insert(), [{"value": value} for value in value_set]
+        )
+        return sa.select([temp_table_obj.c.value])
+
+    def _get_value_set_temp_table_type(self, column, value_set):
+        """Return an unbounded column type able to hold every value in value_set, or None to use an IN (...) list.
+
+        The reflected type of the column is not used as is, since its length or precision could reject or truncate
+        values that an IN (...) list compares without loss.
+        """
+        column_type = self._columns_by_name.get(column, {}).get("type")
+        if isinstance(column_type, sa.String) and all(
+            isinstance(value, str) for value in value_set
+        ):
+            return sa.Text()
+        if isinstance(column_type, sa.Integer) and all(
+            isinstance(value, int) and not isinstance(value, bool)
+            for value in value_set
+        ):
+            return sa.BigInteger()
+        return None
+
+    def _drop_value_set_temp_tables(self):
+        while self._value_set_temp_tables:
+            self._value_set_temp_tables.pop().drop(self.engine)
 
     @DocInherit
     @MetaSqlAlchemyDataset.column_map_expectation
@@ -1693,6 +2249,9 @@ WHERE
         catch_exceptions=None,
         meta=None,
     ):
+        if min_value is None and max_value is None:
+            raise ValueError("min_value and max_value cannot both be None")
+
         if parse_strings_as_datetimes:
             if min_value:
                 min_value = parse(min_value)
@@ -1700,11 +2259,13 @@ WHERE
             if max_value:
                 max_value = parse(max_value)
 
-        if min_value is not None and max_value is not None and min_value > max_value:
-            raise ValueError("min_value cannot be greater than max_value")
-
-        if min_value is None and max_value is None:
-            raise ValueError("min_value and max_value cannot both be None")
+        if min_value is not None and max_value is not None:
+            try:
+                min_value_greater_than_max_value = min_value > max_value
+            except TypeError:
+                raise ValueError("min_value and max_value must be of comparable types")
+            if min_value_greater_than_max_value:
+                raise ValueError("min_value cannot be greater than max_value")
 
         if min_value is None:
             if strict_max:
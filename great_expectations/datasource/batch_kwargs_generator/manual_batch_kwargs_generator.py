@@ -104,6 +104,15 @@ class ManualBatchKwargsGenerator(BatchKwargsGenerator):
                 pass
         return partition_ids
 
+    @staticmethod
+    def _batch_kwargs_from_definition(definition):
+        """Copy an asset definition into batch kwargs, leaving out its partition_id."""
+        return {
+            key: deepcopy(value)
+            for key, value in definition.items()
+            if key != "partition_id"
+        }
+
     def _build_batch_kwargs(self, batch_parameters):
         """Build batch kwargs from a partition id."""
         partition_id = batch_parameters.pop("partition_id", None)
@@ -116,15 +125,17 @@ class ManualBatchKwargsGenerator(BatchKwargsGenerator):
                 for batch_request in asset_definition:
                     try:
                         if batch_request["partition_id"] == partition_id:
-                            batch_kwargs = deepcopy(batch_request)
-                            batch_kwargs.pop("partition_id")
+                            batch_kwargs = self._batch_kwargs_from_definition(
+                                batch_request
+                            )
                     except KeyError:
                         pass
             elif isinstance(asset_definition, dict):
                 try:
                     if asset_definition["partition_id"] == partition_id:
-                        batch_kwargs = deepcopy(asset_definition)
-                        batch_kwargs.pop("partition_id")
+                        batch_kwargs = self._batch_kwargs_from_definition(
+                            asset_definition
+                        )
                 except KeyError:
                     pass
         else:
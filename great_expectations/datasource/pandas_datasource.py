@@ -1,3 +1,4 @@
+import copy
 import datetime
 import logging
 import uuid
@@ -5,6 +6,7 @@ import warnings
 from collections import Callable
 from functools import partial
 from io import BytesIO
+from pathlib import PurePath
 
 import pandas as pd
 
@@ -21,6 +23,19 @@ logger = logging.getLogger(__name__)
 
 HASH_THRESHOLD = 1e9
 
+# Reader method (and any reader options) to use for each recognized file suffix
+READER_METHOD_BY_SUFFIX = {
+    ".csv": {"reader_method": "read_csv"},
+    ".tsv": {"reader_method": "read_csv"},
+    ".parquet": {"reader_method": "read_parquet"},
+    ".xlsx": {"reader_method": "read_excel"},
+    ".xls": {"reader_method": "read_excel"},
+    ".json": {"reader_method": "read_json"},
+    ".pkl": {"reader_method": "read_pickle"},
+    ".feather": {"reader_method": "read_feather"},
+    ".csv.gz": {"reader_method": "read_csv", "reader_options": {"compression": "gzip"}},
+}
+
 
 class PandasDatasource(LegacyDatasource):
     """The PandasDatasource produces PandasDataset objects and supports generators capable of
@@ -267,23 +282,11 @@ class PandasDatasource(LegacyDatasource):
 
     @staticmethod
     def guess_reader_method_from_path(path):
-        if path.endswith(".csv") or path.endswith(".tsv"):
-            return {"reader_method": "read_csv"}
-        elif path.endswith(".parquet"):
-            return {"reader_method": "read_parquet"}
-        elif path.endswith(".xlsx") or path.endswith(".xls"):
-            return {"reader_method": "read_excel"}
-        elif path.endswith(".json"):
-            return {"reader_method": "read_json"}
-        elif path.endswith(".pkl"):
-            return {"reader_method": "read_pickle"}
-        elif path.endswith(".feather"):
-            return {"reader_method": "read_feather"}
-        elif path.endswith(".csv.gz") or path.endswith(".csv.gz"):
-            return {
-                "reader_method": "read_csv",
-                "reader_options": {"compression": "gzip"},
-            }
+        suffixes = PurePath(path).suffixes
+        # Check the compound suffix first so that e.g. ".csv.gz" is recognized as compressed csv
+        for suffix in ("".join(suffixes[-2:]), "".join(suffixes[-1:])):
+            if suffix in READER_METHOD_BY_SUFFIX:
+                return copy.deepcopy(READER_METHOD_BY_SUFFIX[suffix])
 
         raise BatchKwargsError(
             "Unable to determine reader method from path: %s" % path, {"path": path}
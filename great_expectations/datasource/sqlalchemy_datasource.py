@@ -28,7 +28,7 @@ except ImportError:
     logger.debug("Unable to import sqlalchemy.")
 
 
-if sqlalchemy != None:
+if sqlalchemy is not None:
     try:
         import google.auth
 
@@ -15,9 +15,8 @@ class DotDict(dict):
     configuration objects.
     """
 
-    def __getattr__(self, item):
-        return self.get(item)
-
+    # Bound directly to the dict methods, so attribute access does not go through a Python-level function call
+    __getattr__ = dict.get
     __setattr__ = dict.__setitem__
     __delattr__ = dict.__delitem__
 
@@ -1,15 +1,14 @@
 import copy
-import cProfile
 import importlib
 import io
 import json
 import logging
 import os
-import pstats
 import time
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from gc import get_referrers
 from inspect import (
     ArgInfo,
@@ -24,12 +23,14 @@ from inspect import (
 )
 from pathlib import Path
 from types import CodeType, FrameType, ModuleType
-from typing import Any, Callable, Optional
+from typing import Any, Callable, List, Optional
 
 from dateutil.parser import parse
-from pkg_resources import Distribution
 
-from great_expectations.core.expectation_suite import expectationSuiteSchema
+from great_expectations.core.expectation_suite import (
+    ExpectationSuite,
+    expectationSuiteSchema,
+)
 from great_expectations.exceptions import (
     PluginClassNotFoundError,
     PluginModuleNotFoundError,
@@ -46,8 +47,16 @@ except ModuleNotFoundError:
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def profile(func: Callable = None) -> Callable:
+    import cProfile
+    import pstats
+
     @wraps(func)
     def profile_function_call(*args, **kwargs) -> Any:
         pr: cProfile.Profile = cProfile.Profile()
@@ -67,12 +76,12 @@ def profile(func: Callable = None) -> Callable:
 def measure_execution_time(func: Callable = None) -> Callable:
     @wraps(func)
     def compute_delta_t(*args, **kwargs) -> Any:
-        time_begin: int = int(round(time.time() * 1000))
+        time_begin: float = time.perf_counter()
         try:
             return func(*args, **kwargs)
         finally:
-            time_end: int = int(round(time.time() * 1000))
-            delta_t: int = time_end - time_begin
+            time_end: float = time.perf_counter()
+            delta_t: int = int(round((time_end - time_begin) * 1000))
             bound_args: BoundArguments = signature(func).bind(*args, **kwargs)
             call_args: OrderedDict = bound_args.arguments
             print(
@@ -83,8 +92,8 @@ def measure_execution_time(func: Callable = None) -> Callable:
 
 
 # noinspection SpellCheckingInspection
-def get_project_distribution() -> Optional[Distribution]:
-    ditr: Distribution
+def get_project_distribution() -> Optional[importlib_metadata.Distribution]:
+    ditr: importlib_metadata.Distribution
     for distr in importlib_metadata.distributions():
         relative_path: Path
         try:
@@ -247,6 +256,84 @@ def load_class(class_name: str, module_name: str):
     return klass_
 
 
+def _is_local_uncompressed_path(filename) -> bool:
+    """Return whether filename names a local file that is not compressed as a whole, and so can be memory-mapped."""
+    return (
+        isinstance(filename, (str, os.PathLike))
+        and "://" not in str(filename)
+        and Path(filename).suffix.lower() not in [".gz", ".bz2", ".zip", ".xz"]
+    )
+
+
+def _get_expectation_suite_columns(expectation_suite) -> Optional[List[str]]:
+    """
+    Return the columns named by the expectations of an expectation suite, in order of first reference
+
+    Args:
+        expectation_suite: the expectation suite, as an ExpectationSuite or a dict
+
+    Returns:
+        A list of column names, or None if the suite has an expectation that may depend on columns it does not name:
+        a table expectation, which checks the table's columns or rows as a whole, one that takes a column_list, one
+        that checks a column's position with column_index, or one that filters rows with a row_condition
+    """
+    if isinstance(expectation_suite, dict):
+        expectations = [
+            (expectation["expectation_type"], expectation["kwargs"])
+            for expectation in expectation_suite.get("expectations", [])
+        ]
+    else:
+        expectations = [
+            (expectation.expectation_type, expectation.kwargs)
+            for expectation in expectation_suite.expectations
+        ]
+    if len(expectations) == 0:
+        return None
+
+    columns: List[str] = []
+    for expectation_type, kwargs in expectations:
+        if (
+            expectation_type.startswith("expect_table_")
+            or "column_list" in kwargs
+            or kwargs.get("row_condition") is not None
+            or kwargs.get("column_index") is not None
+        ):
+            return None
+        expectation_columns = [
+            kwargs[key] for key in ["column", "column_A", "column_B"] if key in kwargs
+        ]
+        if len(expectation_columns) == 0:
+            return None
+        for column in expectation_columns:
+            if column not in columns:
+                columns.append(column)
+    return columns
+
+
+def _load_expectation_suite(expectation_suite: dict) -> ExpectationSuite:
+    """
+    Load an expectation suite configuration, reusing the suite loaded from an identical earlier configuration
+
+    Validating many data assets against the same configuration would otherwise deserialize it every time.
+
+    Args:
+        expectation_suite: the expectation suite configuration
+
+    Returns:
+        An ExpectationSuite, which may be shared with other callers and so must not be modified
+    """
+    try:
+        expectation_suite_json = json.dumps(expectation_suite, sort_keys=True)
+    except TypeError:
+        return expectationSuiteSchema.load(expectation_suite)
+    return _load_expectation_suite_json(expectation_suite_json)
+
+
+@lru_cache(maxsize=128)
+def _load_expectation_suite_json(expectation_suite_json: str) -> ExpectationSuite:
+    return expectationSuiteSchema.loads(expectation_suite_json)
+
+
 def _convert_to_dataset_class(df, dataset_class, expectation_suite=None, profiler=None):
     """
     Convert a (pandas) dataframe to a great_expectations dataset, with (optional) expectation_suite
@@ -258,14 +345,24 @@ def _convert_to_dataset_class(df, dataset_class, expectation_suite=None, profile
         profiler: the profiler to use to generate baseline expectations, if any
 
     Returns:
-        A new Dataset object
+        A new Dataset object. A pandas dataset shares its data with df rather than holding a copy of it.
     """
 
     if expectation_suite is not None:
-        # Create a dataset of the new class type, and manually initialize expectations according to
-        # the provided expectation suite
-        new_df = dataset_class.from_dataset(df)
-        new_df._initialize_expectations(expectation_suite)
+        if isinstance(expectation_suite, dict):
+            expectation_suite = _load_expectation_suite(expectation_suite)
+        if _from_dataset_accepts_kwarg(dataset_class, "expectation_suite"):
+            # Create a dataset of the new class type, initializing its expectations from the provided expectation
+            # suite while it is constructed rather than replacing the default ones afterwards
+            new_df = dataset_class.from_dataset(df, expectation_suite=expectation_suite)
+        else:
+            # Create a dataset of the new class type, and manually initialize expectations according to
+            # the provided expectation suite
+            new_df = dataset_class.from_dataset(df)
+            new_df._initialize_expectations(expectation_suite)
+    elif _from_dataset_accepts_kwarg(dataset_class, "profiler"):
+        # Instantiate the new Dataset with default expectations, which the profiler builds on during construction
+        new_df = dataset_class.from_dataset(df, profiler=profiler)
     else:
         # Instantiate the new Dataset with default expectations
         new_df = dataset_class.from_dataset(df)
@@ -275,6 +372,16 @@ def _convert_to_dataset_class(df, dataset_class, expectation_suite=None, profile
     return new_df
 
 
+def _from_dataset_accepts_kwarg(dataset_class, name: str) -> bool:
+    """Return whether dataset_class.from_dataset accepts the keyword argument name, which overrides written against
+    the earlier from_dataset(cls, dataset=None) signature do not."""
+    parameters = signature(dataset_class.from_dataset).parameters.values()
+    return any(
+        parameter.name == name or parameter.kind == Parameter.VAR_KEYWORD
+        for parameter in parameters
+    )
+
+
 def _load_and_convert_to_dataset_class(
     df, class_name, module_name, expectation_suite=None, profiler=None
 ):
@@ -296,6 +403,100 @@ def _load_and_convert_to_dataset_class(
     return _convert_to_dataset_class(df, dataset_class, expectation_suite, profiler)
 
 
+def _convert_chunks_to_dataset_class(
+    chunks, dataset_class, expectation_suite=None, profiler=None
+):
+    """
+    Convert the chunks read by a chunked pandas reader to great_expectations datasets, one chunk at a time
+
+    Args:
+        chunks: the iterator of DataFrame chunks returned by a pandas reader called with chunksize
+        dataset_class: the class to which to convert each chunk
+        expectation_suite: the expectation suite that should be attached to each resulting dataset
+        profiler: the profiler to use to generate baseline expectations for each chunk, if any
+
+    Returns:
+        A generator of new Dataset objects, one per chunk
+    """
+    try:
+        for chunk in chunks:
+            yield _convert_to_dataset_class(
+                chunk, dataset_class, expectation_suite, profiler
+            )
+    finally:
+        chunks.close()
+
+
+def _load_and_convert_chunks_to_dataset_class(
+    chunks,
+    class_name,
+    module_name,
+    dataset_class=None,
+    expectation_suite=None,
+    profiler=None,
+):
+    """
+    Convert the chunks read by a chunked pandas reader to great_expectations datasets, one chunk at a time
+
+    Args:
+        chunks: the iterator of DataFrame chunks returned by a pandas reader called with chunksize
+        class_name (str): class to which to convert each chunk, if dataset_class is not specified
+        module_name (str): dataset module from which to try to dynamically load the relevant module
+        dataset_class: If specified, the class to which to convert each chunk
+        expectation_suite: the expectation suite that should be attached to each resulting dataset
+        profiler: the profiler to use to generate baseline expectations for each chunk, if any
+
+    Returns:
+        A generator of new Dataset objects, one per chunk
+    """
+    if dataset_class is None:
+        verify_dynamic_loading_support(module_name=module_name)
+        dataset_class = load_class(class_name, module_name)
+    return _convert_chunks_to_dataset_class(
+        chunks, dataset_class, expectation_suite, profiler
+    )
+
+
+def _pandas_supports_pyarrow_csv_engine() -> bool:
+    """Return whether pandas.read_csv accepts engine="pyarrow", which was added in pandas 1.4."""
+    import pandas as pd
+
+    major, minor = (int(part) for part in pd.__version__.split(".")[:2])
+    return (major, minor) >= (1, 4)
+
+
+def _read_csv_with_pyarrow(filename, *args, **kwargs):
+    """Read a csv file into a pandas DataFrame with pyarrow.csv, for pandas versions without the pyarrow engine."""
+    import pyarrow.csv
+
+    kwargs.pop("engine")
+    convert_options = pyarrow.csv.ConvertOptions()
+    if "usecols" in kwargs:
+        convert_options.include_columns = list(kwargs.pop("usecols"))
+    if args or kwargs:
+        raise ValueError(
+            "engine='pyarrow' only supports the usecols option with pandas < 1.4"
+        )
+    table = pyarrow.csv.read_csv(
+        filename,
+        read_options=pyarrow.csv.ReadOptions(block_size=32 << 20),
+        convert_options=convert_options,
+    )
+    # Free each column's arrow buffers as soon as it has been converted
+    return table.to_pandas(self_destruct=True)
+
+
+def _csv_uses_c_engine(kwargs) -> bool:
+    """Return whether pandas.read_csv parses with its C engine given these options, rather than with the python
+    engine, which cannot sniff or split on a regular expression separator in a memory-mapped file."""
+    if kwargs.get("engine", "c") not in ["c", None] or kwargs.get("skipfooter"):
+        return False
+    sep = kwargs.get("delimiter")
+    if sep is None:
+        sep = kwargs.get("sep", ",")
+    return sep is not None and (len(sep) == 1 or sep == r"\s+")
+
+
 def read_csv(
     filename,
     class_name="PandasDataset",
@@ -304,6 +505,7 @@ def read_csv(
     expectation_suite=None,
     profiler=None,
     *args,
+    prune_columns=False,
     **kwargs,
 ):
     """Read a file using Pandas read_csv and return a great_expectations dataset.
@@ -316,13 +518,63 @@ def read_csv(
             if not specified, try to load the class named via the class_name and module_name parameters
         expectation_suite (string): path to great_expectations expectation suite file
         profiler (Profiler class): profiler to use when creating the dataset (default is None)
+        prune_columns (boolean): If True, only read the columns named by the expectations of expectation_suite
+            that are in the file, unless usecols is passed or the suite has an expectation that may depend on other
+            columns
+
+    Any other arguments are passed to pandas. If chunksize is passed, the file is read in chunks of that many rows.
+    Local uncompressed files parsed by the C engine are memory-mapped unless memory_map=False is passed; the python
+    engine, used for instance with sep=None or a regular expression sep, reads them as usual. If engine="pyarrow" is
+    passed, the file is parsed by the multi-threaded pyarrow CSV reader; with pandas older than 1.4 only usecols is
+    supported alongside it.
 
     Returns:
-        great_expectations dataset
+        great_expectations dataset, or a generator of great_expectations datasets, one per chunk, if chunksize is
+        passed
     """
     import pandas as pd
 
-    df = pd.read_csv(filename, *args, **kwargs)
+    use_pyarrow = kwargs.get("engine") == "pyarrow"
+    compression = kwargs.get("compression", "infer")
+    if (
+        _csv_uses_c_engine(kwargs)
+        and compression in ["infer", None]
+        and _is_local_uncompressed_path(filename)
+    ):
+        # Parse the file straight from the page cache instead of copying it into a read buffer first
+        kwargs.setdefault("memory_map", True)
+    if prune_columns and expectation_suite is not None and "usecols" not in kwargs:
+        columns = _get_expectation_suite_columns(expectation_suite)
+        if columns is not None and not use_pyarrow:
+            # Unlike a list, a callable usecols skips the columns that are missing from the file instead of raising,
+            # so that the expectations naming them fail on validation
+            column_set = set(columns)
+            kwargs["usecols"] = lambda column: column in column_set
+        elif columns is not None and isinstance(filename, (str, os.PathLike)):
+            # pyarrow only accepts a list of columns, which must all be in the file
+            header = pd.read_csv(
+                filename,
+                nrows=0,
+                **{
+                    key: value
+                    for key, value in kwargs.items()
+                    if key not in ["engine", "chunksize"]
+                },
+            ).columns
+            kwargs["usecols"] = [column for column in columns if column in header]
+    if use_pyarrow and not _pandas_supports_pyarrow_csv_engine():
+        df = _read_csv_with_pyarrow(filename, *args, **kwargs)
+    else:
+        df = pd.read_csv(filename, *args, **kwargs)
+    if kwargs.get("chunksize") is not None:
+        return _load_and_convert_chunks_to_dataset_class(
+            chunks=df,
+            class_name=class_name,
+            module_name=module_name,
+            dataset_class=dataset_class,
+            expectation_suite=expectation_suite,
+            profiler=profiler,
+        )
     if dataset_class is not None:
         return _convert_to_dataset_class(
             df=df,
@@ -340,6 +592,28 @@ def read_csv(
         )
 
 
+def _load_json(json_bytes: bytes) -> Any:
+    """Parse a JSON document, using the faster orjson library when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(json_bytes)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the json module, which for example also accepts NaN and Infinity
+            pass
+    return json.loads(json_bytes)
+
+
+def _dump_json(json_obj: Any) -> str:
+    """Serialize an object to a JSON document, using the faster orjson library when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(json_obj).decode("utf-8")
+        except TypeError:
+            # e.g. dicts with non-string keys, which orjson does not serialize by default
+            pass
+    return json.dumps(json_obj)
+
+
 def read_json(
     filename,
     class_name="PandasDataset",
@@ -363,19 +637,34 @@ def read_json(
         accessor_func (Callable): functions to transform the json object in the file
         profiler (Profiler class): profiler to use when creating the dataset (default is None)
 
+    Any other arguments are passed to pandas. If chunksize is passed together with lines=True, the file is read in
+    chunks of that many lines.
+
     Returns:
-        great_expectations dataset
+        great_expectations dataset, or a generator of great_expectations datasets, one per chunk, if chunksize is
+        passed
     """
     import pandas as pd
 
     if accessor_func is not None:
-        json_obj = json.load(open(filename, "rb"))
+        with open(filename, "rb") as infile:
+            json_obj = _load_json(infile.read())
         json_obj = accessor_func(json_obj)
-        df = pd.read_json(json.dumps(json_obj), *args, **kwargs)
+        df = pd.read_json(_dump_json(json_obj), *args, **kwargs)
 
     else:
         df = pd.read_json(filename, *args, **kwargs)
 
+    if kwargs.get("chunksize") is not None:
+        return _load_and_convert_chunks_to_dataset_class(
+            chunks=df,
+            class_name=class_name,
+            module_name=module_name,
+            dataset_class=dataset_class,
+            expectation_suite=expectation_suite,
+            profiler=profiler,
+        )
+
     if dataset_class is not None:
         return _convert_to_dataset_class(
             df=df,
@@ -425,13 +714,21 @@ def read_excel(
         verify_dynamic_loading_support(module_name=module_name)
         dataset_class = load_class(class_name=class_name, module_name=module_name)
     if isinstance(df, dict):
-        for key in df:
-            df[key] = _convert_to_dataset_class(
-                df=df[key],
-                dataset_class=dataset_class,
-                expectation_suite=expectation_suite,
-                profiler=profiler,
+        # Worksheets are independent of each other, so convert (and profile) them concurrently
+        with ThreadPoolExecutor(
+            max_workers=max(min(len(df), os.cpu_count() or 1), 1)
+        ) as executor:
+            datasets = executor.map(
+                lambda sheet: _convert_to_dataset_class(
+                    df=sheet,
+                    dataset_class=dataset_class,
+                    expectation_suite=expectation_suite,
+                    profiler=profiler,
+                ),
+                df.values(),
             )
+            for key, dataset in zip(list(df), datasets):
+                df[key] = dataset
     else:
         df = _convert_to_dataset_class(
             df=df,
@@ -463,12 +760,24 @@ def read_table(
         expectation_suite (string): path to great_expectations expectation suite file
         profiler (Profiler class): profiler to use when creating the dataset (default is None)
 
+    Any other arguments are passed to pandas. If chunksize is passed, the file is read in chunks of that many rows.
+
     Returns:
-        great_expectations dataset
+        great_expectations dataset, or a generator of great_expectations datasets, one per chunk, if chunksize is
+        passed
     """
     import pandas as pd
 
     df = pd.read_table(filename, *args, **kwargs)
+    if kwargs.get("chunksize") is not None:
+        return _load_and_convert_chunks_to_dataset_class(
+            chunks=df,
+            class_name=class_name,
+            module_name=module_name,
+            dataset_class=dataset_class,
+            expectation_suite=expectation_suite,
+            profiler=profiler,
+        )
     if dataset_class is not None:
         return _convert_to_dataset_class(
             df=df,
@@ -530,6 +839,28 @@ def read_feather(
         )
 
 
+def _get_parquet_dataset(path):
+    """Open a local parquet file, or a directory of hive-partitioned parquet files, as a pyarrow.dataset Dataset."""
+    import pyarrow.dataset
+
+    partitioning = None
+    if os.path.isdir(path):
+        # Partition keys are dictionary encoded, so that they become categorical columns as with pandas.read_parquet
+        partitioning = pyarrow.dataset.HivePartitioning.discover(infer_dictionary=True)
+    return pyarrow.dataset.dataset(
+        os.fspath(path), format="parquet", partitioning=partitioning
+    )
+
+
+def _read_parquet_dataset(path, columns=None, filter=None):
+    """Read a parquet file, or a directory of hive-partitioned parquet files, into a pandas DataFrame with
+    pyarrow.dataset."""
+    dataset = _get_parquet_dataset(path)
+    # Only the requested columns, and the partitions and row groups that can match filter, are read
+    table = dataset.to_table(columns=columns, filter=filter)
+    return table.to_pandas(self_destruct=True)
+
+
 def read_parquet(
     filename,
     class_name="PandasDataset",
@@ -538,6 +869,7 @@ def read_parquet(
     expectation_suite=None,
     profiler=None,
     *args,
+    prune_columns=False,
     **kwargs,
 ):
     """Read a file using Pandas read_parquet and return a great_expectations dataset.
@@ -550,13 +882,58 @@ def read_parquet(
             if not specified, try to load the class named via the class_name and module_name parameters
         expectation_suite (string): path to great_expectations expectation suite file
         profiler (Profiler class): profiler to use when creating the dataset (default is None)
+        prune_columns (boolean): If True, only read the columns named by the expectations of expectation_suite
+            that are in the file, unless columns is passed, the file's schema cannot be read with pyarrow, or the suite
+            has an expectation that may depend on other columns
+
+    Local files are read through a 1MB buffer. A local directory of hive-partitioned files is scanned with
+    pyarrow.dataset when pyarrow is installed and no options other than engine and columns are passed. Local files
+    and directories read this way also accept filter, a pyarrow.dataset Expression such as
+    pyarrow.dataset.field("year") == 2020, which is pushed down to the scan so that only matching partitions and row
+    groups are read; filter cannot be combined with other pandas options or with remote paths.
 
     Returns:
         great_expectations dataset
     """
     import pandas as pd
 
-    df = pd.read_parquet(filename, *args, **kwargs)
+    is_local = isinstance(filename, (str, os.PathLike)) and "://" not in str(filename)
+    if (
+        prune_columns
+        and expectation_suite is not None
+        and "columns" not in kwargs
+        and is_local
+        and is_library_loadable(library_name="pyarrow.dataset")
+    ):
+        columns = _get_expectation_suite_columns(expectation_suite)
+        if columns is not None:
+            # Columns missing from the file are left out rather than failing the read, so that the expectations naming
+            # them fail on validation
+            schema_names = _get_parquet_dataset(filename).schema.names
+            kwargs["columns"] = [column for column in columns if column in schema_names]
+    use_dataset = (
+        is_local
+        and (os.path.isdir(filename) or "filter" in kwargs)
+        and not args
+        and set(kwargs).issubset({"engine", "columns", "filter"})
+        and kwargs.get("engine", "auto") in ["auto", "pyarrow"]
+        and is_library_loadable(library_name="pyarrow.dataset")
+    )
+    if use_dataset:
+        df = _read_parquet_dataset(
+            filename, columns=kwargs.get("columns"), filter=kwargs.get("filter")
+        )
+    elif "filter" in kwargs:
+        raise ValueError(
+            "filter requires pyarrow.dataset and a local path, and cannot be combined with pandas options other than "
+            "engine='pyarrow' and columns"
+        )
+    elif is_local and os.path.isfile(filename):
+        # Skip pandas' URL and filesystem detection, and read in fewer, larger system calls
+        with open(os.fspath(filename), "rb", buffering=1 << 20) as f:
+            df = pd.read_parquet(f, *args, **kwargs)
+    else:
+        df = pd.read_parquet(filename, *args, **kwargs)
     if dataset_class is not None:
         return _convert_to_dataset_class(
             df=df,
@@ -595,7 +972,7 @@ def from_pandas(
             be run on the dataset to establish a baseline expectation suite.
 
     Returns:
-        great_expectations dataset
+        great_expectations dataset, which shares its data with pandas_df rather than holding a copy of it
     """
     if dataset_class is not None:
         return _convert_to_dataset_class(
@@ -658,6 +1035,29 @@ def read_pickle(
         )
 
 
+def _get_data_context(context_root_dir: str):
+    """Return a DataContext for context_root_dir, reusing the context loaded by an earlier call while its
+    great_expectations.yml is unchanged."""
+    from great_expectations.data_context import DataContext
+
+    context_root_dir = os.path.abspath(context_root_dir)
+    try:
+        config_mtime = os.path.getmtime(
+            os.path.join(context_root_dir, DataContext.GE_YML)
+        )
+    except OSError:
+        # Let DataContext report the missing configuration
+        return DataContext(context_root_dir)
+    return _load_data_context(context_root_dir, config_mtime)
+
+
+@lru_cache(maxsize=32)
+def _load_data_context(context_root_dir: str, config_mtime: float):
+    from great_expectations.data_context import DataContext
+
+    return DataContext(context_root_dir)
+
+
 def validate(
     data_asset,
     expectation_suite=None,
@@ -679,7 +1079,8 @@ def validate(
         expectation_suite: the suite to use, or None to fetch one using a DataContext
         data_asset_name: the name of the data asset to use
         expectation_suite_name: the name of the expectation_suite to use
-        data_context: data context to use to fetch an an expectation suite, or the path from which to obtain one
+        data_context: data context to use to fetch an an expectation suite, or the path from which to obtain one; a
+            context loaded from a path is reused by later calls until its great_expectations.yml changes
         data_asset_class_name: the name of a class to dynamically load a DataAsset class
         data_asset_module_name: the name of the module to dynamically load a DataAsset class
         data_asset_class: a class to use. overrides data_asset_class_name/ data_asset_module_name if provided
@@ -699,15 +1100,13 @@ def validate(
         logger.info("Using expectation suite from DataContext.")
         # Allow data_context to be a string, and try loading it from path in that case
         if isinstance(data_context, str):
-            from great_expectations.data_context import DataContext
-
-            data_context = DataContext(data_context)
+            data_context = _get_data_context(data_context)
         expectation_suite = data_context.get_expectation_suite(
             expectation_suite_name=expectation_suite_name
         )
     else:
         if isinstance(expectation_suite, dict):
-            expectation_suite = expectationSuiteSchema.load(expectation_suite)
+            expectation_suite = _load_expectation_suite(expectation_suite)
         if data_asset_name is not None:
             raise ValueError(
                 "When providing an expectation suite, data_asset_name cannot also be provided."
@@ -770,6 +1169,72 @@ def validate(
     return data_asset_.validate(*args, data_context=data_context, **kwargs)
 
 
+def _validate_chunk(chunk, dataset_class, expectation_suite):
+    """Convert a DataFrame chunk to dataset_class and validate it against expectation_suite, in a worker process."""
+    return _convert_to_dataset_class(
+        chunk, dataset_class=dataset_class, expectation_suite=expectation_suite
+    ).validate()
+
+
+def validate_chunked(
+    filename,
+    expectation_suite,
+    chunksize=1000000,
+    max_workers=None,
+    class_name="PandasDataset",
+    module_name="great_expectations.dataset",
+    dataset_class=None,
+    **kwargs,
+):
+    """Read a csv file in chunks and validate each chunk against an expectation suite, in parallel worker processes.
+
+    Column map expectations hold for the whole file when they hold for every chunk; aggregate expectations, such as
+    expect_column_mean_to_be_between or expect_table_row_count_to_equal, are evaluated for each chunk on its own.
+
+    Args:
+        filename (string): path to file to read
+        expectation_suite: the suite to validate each chunk against, as an ExpectationSuite or a dict
+        chunksize (int): the number of rows in each chunk
+        max_workers (int): the number of worker processes; defaults to the number of CPUs
+        class_name (str): class to which to convert each chunk
+        module_name (str): dataset module from which to try to dynamically load the relevant module
+        dataset_class (Dataset): If specified, the class to which to convert each chunk; if not specified, try to
+            load the class named via the class_name and module_name parameters
+
+    Any other arguments are passed to pandas read_csv. At most two chunks per worker are read ahead of validation.
+
+    Returns:
+        A list of ExpectationSuiteValidationResult, one per chunk, in file order
+    """
+    import pandas as pd
+
+    if dataset_class is None:
+        verify_dynamic_loading_support(module_name=module_name)
+        dataset_class = load_class(class_name, module_name)
+    if isinstance(expectation_suite, dict):
+        expectation_suite = _load_expectation_suite(expectation_suite)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    results = []
+    chunks = pd.read_csv(filename, chunksize=chunksize, **kwargs)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(
+                    executor.submit(
+                        _validate_chunk, chunk, dataset_class, expectation_suite
+                    )
+                )
+                if len(pending) >= 2 * max_workers:
+                    results.append(pending.popleft().result())
+            results.extend(future.result() for future in pending)
+    finally:
+        chunks.close()
+    return results
+
+
 # https://stackoverflow.com/questions/9727673/list-directory-tree-structure-in-python
 def gen_directory_tree_str(startpath):
     """Print the structure of directory as a tree:
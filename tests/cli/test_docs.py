@@ -16,6 +16,24 @@ except ImportError:
     from unittest import mock
 
 
+# Usage statistics events shared by the assertions on mock_emit.call_args_list
+_EMIT_INIT = mock.call(
+    {"event_payload": {}, "event": "data_context.__init__", "success": True}
+)
+_EMIT_BUILD_DATA_DOCS = mock.call(
+    {"event_payload": {}, "event": "data_context.build_data_docs", "success": True}
+)
+_EMIT_OPEN_DATA_DOCS = mock.call(
+    {"event_payload": {}, "event": "data_context.open_data_docs", "success": True}
+)
+_EMIT_CLI_DOCS_BUILD = mock.call(
+    {"event": "cli.docs.build", "event_payload": {"api_version": "v3"}, "success": True}
+)
+_EMIT_CLI_DOCS_LIST = mock.call(
+    {"event": "cli.docs.list", "event_payload": {"api_version": "v3"}, "success": True}
+)
+
+
 def test_docs_help_output(caplog):
     runner = CliRunner(mix_stderr=False)
     result = runner.invoke(cli, ["--v3-api", "docs"], catch_exceptions=False)
@@ -58,30 +76,10 @@ def test_docs_build_view(
 
     assert mock_emit.call_count == 4
     assert mock_emit.call_args_list == [
-        mock.call(
-            {"event_payload": {}, "event": "data_context.__init__", "success": True}
-        ),
-        mock.call(
-            {
-                "event_payload": {},
-                "event": "data_context.build_data_docs",
-                "success": True,
-            }
-        ),
-        mock.call(
-            {
-                "event_payload": {},
-                "event": "data_context.open_data_docs",
-                "success": True,
-            }
-        ),
-        mock.call(
-            {
-                "event": "cli.docs.build",
-                "event_payload": {"api_version": "v3"},
-                "success": True,
-            }
-        ),
+        _EMIT_INIT,
+        _EMIT_BUILD_DATA_DOCS,
+        _EMIT_OPEN_DATA_DOCS,
+        _EMIT_CLI_DOCS_BUILD,
     ]
 
     context = DataContext(root_dir)
@@ -140,23 +138,9 @@ def test_docs_build_no_view(
 
     assert mock_emit.call_count == 3
     assert mock_emit.call_args_list == [
-        mock.call(
-            {"event_payload": {}, "event": "data_context.__init__", "success": True}
-        ),
-        mock.call(
-            {
-                "event_payload": {},
-                "event": "data_context.build_data_docs",
-                "success": True,
-            }
-        ),
-        mock.call(
-            {
-                "event": "cli.docs.build",
-                "event_payload": {"api_version": "v3"},
-                "success": True,
-            }
-        ),
+        _EMIT_INIT,
+        _EMIT_BUILD_DATA_DOCS,
+        _EMIT_CLI_DOCS_BUILD,
     ]
 
     context = DataContext(root_dir)
@@ -211,23 +195,9 @@ def test_docs_build_assume_yes(
 
     assert mock_emit.call_count == 3
     assert mock_emit.call_args_list == [
-        mock.call(
-            {"event_payload": {}, "event": "data_context.__init__", "success": True}
-        ),
-        mock.call(
-            {
-                "event_payload": {},
-                "event": "data_context.build_data_docs",
-                "success": True,
-            }
-        ),
-        mock.call(
-            {
-                "event": "cli.docs.build",
-                "event_payload": {"api_version": "v3"},
-                "success": True,
-            }
-        ),
+        _EMIT_INIT,
+        _EMIT_BUILD_DATA_DOCS,
+        _EMIT_CLI_DOCS_BUILD,
     ]
 
     assert_no_logging_messages_or_tracebacks(
@@ -280,16 +250,8 @@ def test_docs_list(
 
     assert mock_emit.call_count == 2
     assert mock_emit.call_args_list == [
-        mock.call(
-            {"event_payload": {}, "event": "data_context.__init__", "success": True}
-        ),
-        mock.call(
-            {
-                "event": "cli.docs.list",
-                "event_payload": {"api_version": "v3"},
-                "success": True,
-            }
-        ),
+        _EMIT_INIT,
+        _EMIT_CLI_DOCS_LIST,
     ]
 
     assert_no_logging_messages_or_tracebacks(
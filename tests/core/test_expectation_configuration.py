@@ -1,3 +1,5 @@
+from copy import deepcopy
+
 import pytest
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
@@ -175,3 +177,16 @@ def test_expectation_configuration_patch(config4, config5, config6, config7):
 
     with pytest.raises(ValueError):
         config5.patch("add", "/foo/-", 4)
+
+
+def test_expectation_configuration_deepcopy(config1):
+    config1.process_evaluation_parameters({})
+    copied = deepcopy(config1)
+    assert copied == config1
+    assert copied is not config1
+    assert copied.kwargs["value_set"] is not config1.kwargs["value_set"]
+    assert copied.meta is not config1.meta
+    assert copied._raw_kwargs == config1._raw_kwargs
+
+    copied.kwargs["value_set"].append(4)
+    assert config1.kwargs["value_set"] == [1, 2, 3]
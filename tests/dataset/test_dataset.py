@@ -11,3 +11,19 @@ def test_repeated_append_expectations(dataset, test_backend):
     assert expected_expectation_count == len(
         dataset.get_expectation_suite().expectations
     )
+
+
+def test_is_between():
+    from datetime import datetime
+
+    from great_expectations.dataset import Dataset
+
+    assert Dataset._is_between(5, 1, 10)
+    assert Dataset._is_between(5, None, None)
+    assert Dataset._is_between(10, 1, 10)
+    assert not Dataset._is_between(10, 1, 10, strict_max=True)
+    assert not Dataset._is_between(1, 1, 10, strict_min=True)
+    assert not Dataset._is_between(11, None, 10)
+    # Bounds of None are never compared, so any orderable value is supported
+    assert Dataset._is_between(datetime(2020, 1, 2), datetime(2020, 1, 1), None)
+    assert Dataset._is_between("b", "a", "c")
@@ -1,6 +1,7 @@
 import datetime
 import json
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -431,6 +432,19 @@ def test_from_pandas():
     assert list(ge_df_custom["z"]) == list(pd_df["z"])
 
 
+def test_from_pandas_shares_data():
+    pd_df = pd.DataFrame({"x": [1.0, 3.0, 5.0], "y": [2, 4, 6]})
+    expectation_suite = ge.from_pandas(pd_df).get_expectation_suite()
+
+    for ge_df in [
+        ge.from_pandas(pd_df),
+        ge.from_pandas(pd_df, expectation_suite=expectation_suite),
+        ge.from_pandas(ge.from_pandas(pd_df)),
+    ]:
+        for column in pd_df.columns:
+            assert np.shares_memory(ge_df[column].values, pd_df[column].values)
+
+
 def test_ge_pandas_concatenating_no_autoinspect():
     df1 = ge.dataset.PandasDataset({"A": ["A0", "A1", "A2"], "B": ["B0", "B1", "B2"]})
 
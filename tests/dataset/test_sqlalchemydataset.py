@@ -3,6 +3,8 @@ try:
 except ImportError:
     from unittest import mock
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import pytest
 
@@ -294,6 +296,357 @@ def test_sqlalchemy_dataset_unexpected_count_calculations(sa, unexpected_count_d
     assert res2.result["unexpected_count"] == 5
 
 
+def test_sqlalchemy_dataset_map_expectation_uses_single_query(sa, unexpected_count_df):
+    # Counts and the unexpected values sample are retrieved in a single round trip
+    with mock.patch.object(
+        unexpected_count_df.engine,
+        "execute",
+        wraps=unexpected_count_df.engine.execute,
+    ) as mock_execute:
+        res = unexpected_count_df.expect_column_values_to_be_in_set(
+            "a",
+            value_set=[1],
+            result_format={"result_format": "SUMMARY", "partial_unexpected_count": 3},
+        )
+
+    assert mock_execute.call_count == 1
+    assert res.result["element_count"] == 10
+    assert res.result["missing_count"] == 0
+    assert res.result["unexpected_count"] == 5
+    assert res.result["partial_unexpected_list"] == [2, 2, 2]
+
+
+def test_sqlalchemy_dataset_map_expectation_boolean_only_skips_unexpected_values(
+    sa, unexpected_count_df
+):
+    with mock.patch.object(
+        unexpected_count_df.engine,
+        "execute",
+        wraps=unexpected_count_df.engine.execute,
+    ) as mock_execute:
+        res = unexpected_count_df.expect_column_values_to_be_in_set(
+            "a", value_set=[1], mostly=0.5, result_format="BOOLEAN_ONLY"
+        )
+
+    assert res.success is True
+    assert res.result == {}
+    assert mock_execute.call_count == 1
+    # Only the count query is issued, without the unexpected values sample
+    assert not isinstance(mock_execute.call_args[0][0], sa.sql.CompoundSelect)
+
+
+def test_sqlalchemy_dataset_map_expectation_streams_complete_unexpected_values(
+    sa, unexpected_count_df
+):
+    with mock.patch.object(
+        unexpected_count_df.engine,
+        "execution_options",
+        wraps=unexpected_count_df.engine.execution_options,
+    ) as mock_execution_options:
+        with pytest.warns(UserWarning):
+            res = unexpected_count_df.expect_column_values_to_be_in_set(
+                "a", value_set=[1], result_format="COMPLETE"
+            )
+
+    mock_execution_options.assert_called_once_with(stream_results=True)
+    assert res.result["unexpected_list"] == [2, 2, 2, 2, 2]
+
+
+def test_sqlalchemy_dataset_reuses_column_counts(sa, unexpected_count_df):
+    unexpected_count_df.expect_column_values_to_be_in_set("a", value_set=[1])
+
+    # Counts computed by the map expectation are reused without another query
+    with mock.patch.object(
+        unexpected_count_df.engine,
+        "execute",
+        wraps=unexpected_count_df.engine.execute,
+    ) as mock_execute:
+        assert unexpected_count_df.get_row_count() == 10
+        assert unexpected_count_df.get_column_nonnull_count("a") == 10
+    assert mock_execute.call_count == 0
+
+    unexpected_count_df.invalidate_column_counts()
+    with mock.patch.object(
+        unexpected_count_df.engine,
+        "execute",
+        wraps=unexpected_count_df.engine.execute,
+    ) as mock_execute:
+        assert unexpected_count_df.get_column_nonnull_count("a") == 10
+    assert mock_execute.call_count == 1
+
+
+def test_sqlalchemy_dataset_prefetch_column_aggregates(sa):
+    dataset = get_dataset("sqlite", {"a": [1, 2, 3, 4], "b": ["w", "x", "y", "z"]})
+    dataset.prefetch_column_aggregates()
+
+    # Aggregate expectations reuse the prefetched values without another query
+    with mock.patch.object(
+        dataset.engine,
+        "execute",
+        wraps=dataset.engine.execute,
+    ) as mock_execute:
+        assert dataset.expect_column_max_to_be_between("a", 4, 4).success
+        assert dataset.expect_column_min_to_be_between("a", 1, 1).success
+        assert dataset.expect_column_sum_to_be_between("a", 10, 10).success
+        assert dataset.expect_column_mean_to_be_between("a", 2.5, 2.5).success
+        assert dataset.get_column_max("b") == "z"
+    assert mock_execute.call_count == 0
+
+
+def test_sqlalchemy_dataset_prefetch_column_aggregates_skips_unorderable_columns(sa):
+    dataset = get_dataset(
+        "sqlite",
+        {"a": [1, 2, 3, 4], "c": [True, False, True, True]},
+        schemas={"sqlite": {"a": "INTEGER", "c": "BOOLEAN"}},
+    )
+    dataset.prefetch_column_aggregates()
+
+    assert ("max", "a") in dataset._column_aggregates_cache
+    assert ("min", "c") not in dataset._column_aggregates_cache
+    assert ("max", "c") not in dataset._column_aggregates_cache
+    assert dataset.get_column_nonnull_count("c") == 4
+
+
+def test_sqlalchemy_dataset_prefetch_column_aggregates_falls_back_on_error(sa):
+    dataset = get_dataset("sqlite", {"a": [1, 2, 3, 4]})
+    with mock.patch.object(
+        dataset.engine,
+        "execute",
+        side_effect=sa.exc.ProgrammingError("SELECT", {}, Exception("unsupported")),
+    ):
+        dataset.prefetch_column_aggregates()
+    assert dataset._column_aggregates_cache == {}
+
+    assert dataset.expect_column_max_to_be_between("a", 4, 4).success
+
+
+def test_sqlalchemy_dataset_validate_prefetches_column_aggregates(sa):
+    dataset = get_dataset("sqlite", {"a": [1, 2, 3, 4], "b": [5, 6, 7, 8]})
+    dataset.expect_column_min_to_be_between("a", 1, 1)
+    dataset.expect_column_max_to_be_between("a", 4, 4)
+    dataset.expect_column_mean_to_be_between("b", 6.5, 6.5)
+    dataset.expect_column_values_to_not_be_null("b")
+    dataset.invalidate_column_counts()
+
+    with mock.patch.object(
+        dataset,
+        "prefetch_column_aggregates",
+        wraps=dataset.prefetch_column_aggregates,
+    ) as prefetch:
+        res = dataset.validate()
+    prefetch.assert_called_once_with(["a", "b"])
+    assert res.success is True
+
+
+def test_sqlalchemy_dataset_row_count_from_table_statistics_falls_back_to_count(
+    sa,
+):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3]}).to_sql(name="test_table", con=engine, index=False)
+    dataset = SqlAlchemyDataset(
+        "test_table",
+        engine=engine,
+        batch_kwargs={"use_table_statistics_for_row_count": True},
+    )
+
+    # sqlite does not expose table statistics, so the row count is computed with COUNT
+    assert dataset._get_row_count_from_table_statistics() is None
+    assert dataset.expect_table_row_count_to_equal(3).success
+
+
+def test_sqlalchemy_dataset_row_count_from_bigquery_statistics_without_dataset_id(
+    sa, monkeypatch
+):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3]}).to_sql(name="test_table", con=engine, index=False)
+    dataset = SqlAlchemyDataset(
+        "test_table",
+        engine=engine,
+        batch_kwargs={"use_table_statistics_for_row_count": True},
+    )
+
+    # A bigquery dialect without a dataset_id attribute and an unqualified table name give no statistics table
+    monkeypatch.setattr(dataset.sql_engine_dialect, "name", "bigquery")
+    assert not hasattr(dataset.sql_engine_dialect, "dataset_id")
+    assert dataset._get_row_count_from_table_statistics() is None
+
+
+def test_sqlalchemy_dataset_reflects_columns_on_every_instantiation(sa):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3]}).to_sql(name="test_table", con=engine, index=False)
+    assert SqlAlchemyDataset("test_table", engine=engine).get_table_columns() == ["a"]
+
+    # Without the cache_reflected_columns batch_kwarg, schema changes are seen by the next dataset
+    pd.DataFrame({"b": [1, 2, 3]}).to_sql(
+        name="test_table", con=engine, index=False, if_exists="replace"
+    )
+    assert SqlAlchemyDataset("test_table", engine=engine).get_table_columns() == ["b"]
+
+
+def test_sqlalchemy_dataset_reuses_reflected_columns_until_invalidated(sa):
+    from great_expectations.dataset.sqlalchemy_dataset import (
+        invalidate_reflection_cache,
+    )
+
+    engine = sa.create_engine("sqlite://")
+    batch_kwargs = {"cache_reflected_columns": True}
+    pd.DataFrame({"a": [1, 2, 3]}).to_sql(name="test_table", con=engine, index=False)
+    assert SqlAlchemyDataset(
+        "test_table", engine=engine, batch_kwargs=batch_kwargs
+    ).get_table_columns() == ["a"]
+
+    pd.DataFrame({"b": [1, 2, 3]}).to_sql(
+        name="test_table", con=engine, index=False, if_exists="replace"
+    )
+    assert SqlAlchemyDataset(
+        "test_table", engine=engine, batch_kwargs=batch_kwargs
+    ).get_table_columns() == ["a"]
+
+    invalidate_reflection_cache(engine)
+    assert SqlAlchemyDataset(
+        "test_table", engine=engine, batch_kwargs=batch_kwargs
+    ).get_table_columns() == ["b"]
+
+
+def test_sqlalchemy_dataset_large_value_set_uses_temp_table(sa, unexpected_count_df):
+    unexpected_count_df.value_set_temp_table_min_size = 2
+
+    value_set_clause = unexpected_count_df._get_value_set_clause("a", [1, 3])
+    assert isinstance(value_set_clause, sa.sql.Select)
+    unexpected_count_df._drop_value_set_temp_tables()
+
+    res = unexpected_count_df.expect_column_values_to_be_in_set("a", value_set=[1, 3])
+    assert res.result["unexpected_count"] == 5
+    res = unexpected_count_df.expect_column_values_to_not_be_in_set(
+        "a", value_set=[1, 3]
+    )
+    assert res.result["unexpected_count"] == 5
+
+    # The temporary tables are dropped once each expectation has been evaluated
+    assert unexpected_count_df._value_set_temp_tables == []
+    assert (
+        unexpected_count_df.engine.execute(
+            "SELECT count(*) FROM sqlite_temp_master WHERE name LIKE 'ge_tmp_%'"
+        ).scalar()
+        == 0
+    )
+
+
+def test_sqlalchemy_dataset_large_value_set_falls_back_to_in_list(sa, tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z" * 20]}).to_sql(
+        name="test_sql_data",
+        con=engine,
+        index=False,
+        dtype={"b": sa.types.VARCHAR(5)},
+    )
+    dataset = SqlAlchemyDataset("test_sql_data", engine=engine)
+    dataset.value_set_temp_table_min_size = 2
+
+    # Values are not coerced to a column type that could reject or truncate them
+    assert isinstance(dataset._get_value_set_clause("a", [1, 2.5]), tuple)
+    value_set_clause = dataset._get_value_set_clause("b", ["x", "z" * 20])
+    assert isinstance(value_set_clause, sa.sql.Select)
+    assert isinstance(value_set_clause.columns.value.type, sa.types.Text)
+    dataset._drop_value_set_temp_tables()
+    res = dataset.expect_column_values_to_be_in_set("b", value_set=["x", "z" * 20])
+    assert res.result["unexpected_count"] == 1
+
+    # A pooled Engine may run each statement on a different connection, which cannot see the temporary table
+    dataset.engine = engine
+    assert dataset._get_value_set_clause("a", [1, 3]) == (1, 3)
+    res = dataset.expect_column_values_to_be_in_set("a", value_set=[1, 3])
+    assert res.result["unexpected_count"] == 1
+
+
+def test_sqlalchemy_dataset_reuses_compiled_metric_statements(sa):
+    dataset = get_dataset("sqlite", {"a": [1, 2, 3]}, caching=False)
+
+    assert dataset.get_column_max("a") == 3
+    assert dataset.get_column_max("a") == 3
+    assert dataset.get_column_nonnull_count("a") == 3
+    assert dataset.get_column_nonnull_count("a") == 3
+    assert list(dataset._compiled_statements) == [("max", "a"), ("column_counts", "a")]
+
+
+def test_sqlalchemy_dataset_compiles_quoted_column_names_separately(sa):
+    from sqlalchemy.sql.elements import quoted_name
+
+    dataset = get_dataset("sqlite", {"a": [1, 2, 3]}, caching=False)
+
+    assert dataset.get_column_max("a") == 3
+    assert dataset.get_column_max(quoted_name("a", quote=True)) == 3
+    compiled = list(dataset._compiled_statements.values())
+    assert len(compiled) == 2
+    assert "max(a)" in str(compiled[0])
+    assert 'max("a")' in str(compiled[1])
+
+
+def test_sqlalchemy_dataset_counts_conditions_natively(sa, unexpected_count_df):
+    expected = unexpected_count_df.expect_column_values_to_be_in_set(
+        "a", value_set=[1, 3], result_format="COMPLETE"
+    )
+    unexpected_count_df.invalidate_column_counts()
+
+    unexpected_count_df.boolean_cast_count_dialects = ["sqlite"]
+    condition = sa.column("a").is_(None)
+    assert "CAST" in str(unexpected_count_df._count_where(condition))
+    with mock.patch.object(
+        unexpected_count_df.engine, "execute", wraps=unexpected_count_df.engine.execute
+    ) as execute:
+        res = unexpected_count_df.expect_column_values_to_be_in_set(
+            "a", value_set=[1, 3], result_format="COMPLETE"
+        )
+    assert "CAST" in str(execute.call_args[0][0])
+    assert res.result == expected.result
+
+    unexpected_count_df.count_if_functions = {"sqlite": "count_if"}
+    assert str(unexpected_count_df._count_where(condition)).startswith("count_if(")
+
+
+def test_sqlalchemy_dataset_validate_with_max_workers(sa, tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    pd.DataFrame({"a": [1, 2, 3, None], "b": ["x", "y", "z", "z"]}).to_sql(
+        name="test_sql_data", con=engine, index=False
+    )
+    dataset = SqlAlchemyDataset("test_sql_data", engine=engine)
+    dataset.expect_column_values_to_not_be_null("a")
+    dataset.expect_column_values_to_be_in_set("b", ["x", "y"])
+    dataset.expect_column_max_to_be_between("a", 0, 5)
+    dataset.expect_table_row_count_to_equal(4)
+    expected = dataset.validate()
+
+    # sqlite datasets hold a single Connection; give the workers a pool to draw from
+    dataset.engine = engine
+    dataset.parallel_validation_dialects = ["sqlite"]
+    with mock.patch(
+        "great_expectations.dataset.sqlalchemy_dataset.ThreadPoolExecutor",
+        wraps=ThreadPoolExecutor,
+    ) as executor:
+        result = dataset.validate(max_workers=4)
+
+    executor.assert_called_once_with(max_workers=4)
+    assert result.results == expected.results
+    assert result.statistics == expected.statistics
+
+
+def test_sqlalchemy_dataset_between_rejects_invalid_bounds_without_querying(
+    sa, unexpected_count_df
+):
+    with mock.patch.object(unexpected_count_df.engine, "execute") as execute:
+        with pytest.raises(ValueError, match="comparable types"):
+            unexpected_count_df.expect_column_values_to_be_between(
+                "a", min_value=1, max_value="z"
+            )
+        with pytest.raises(ValueError, match="cannot be greater"):
+            unexpected_count_df.expect_column_values_to_be_between(
+                "a", min_value=5, max_value=1
+            )
+        with pytest.raises(ValueError, match="cannot both be None"):
+            unexpected_count_df.expect_column_values_to_be_between("a")
+    execute.assert_not_called()
+
+
 def test_result_format_warning(sa, unexpected_count_df):
     with pytest.warns(
         UserWarning,
@@ -433,3 +433,25 @@ def test_infer_default_options_partial_functions(reader_fn):
     assert datasource._infer_default_options(
         reader_fn_partial, {}
     ) == datasource._infer_default_options(reader_fn, {})
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("data/file.csv", {"reader_method": "read_csv"}),
+        ("data/file.tsv", {"reader_method": "read_csv"}),
+        ("data/file.v1.parquet", {"reader_method": "read_parquet"}),
+        ("s3://bucket/key/file.xlsx", {"reader_method": "read_excel"}),
+        (
+            "data/file.csv.gz",
+            {"reader_method": "read_csv", "reader_options": {"compression": "gzip"}},
+        ),
+    ],
+)
+def test_guess_reader_method_from_path(path, expected):
+    assert PandasDatasource.guess_reader_method_from_path(path) == expected
+
+
+def test_guess_reader_method_from_path_unknown_suffix():
+    with pytest.raises(BatchKwargsError):
+        PandasDatasource.guess_reader_method_from_path("data/file.gz")
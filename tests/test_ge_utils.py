@@ -1,11 +1,15 @@
 import copy
 import os
+from unittest import mock
 
+import pandas as pd
 import pytest
 
 import great_expectations as ge
+from great_expectations.core.expectation_suite import expectationSuiteSchema
 from great_expectations.core.util import nested_update
 from great_expectations.dataset.util import check_sql_engine_dialect
+from great_expectations.profile.columns_exist import ColumnsExistProfiler
 from great_expectations.util import (
     filter_properties_dict,
     get_currently_executing_function_call_arguments,
@@ -152,6 +156,35 @@ def test_validate_using_data_context_path(
     assert res["statistics"]["evaluated_expectations"] == 2
 
 
+def test_validate_reuses_data_context_loaded_from_path(
+    dataset, data_context_parameterized_expectation_suite
+):
+    data_context_path = data_context_parameterized_expectation_suite.root_directory
+    data_context_class = ge.data_context.DataContext
+    with mock.patch(
+        "great_expectations.data_context.DataContext", wraps=data_context_class
+    ) as data_context_class_mock:
+        data_context_class_mock.GE_YML = data_context_class.GE_YML
+        for _ in range(2):
+            ge.validate(
+                dataset,
+                expectation_suite_name="my_dag_node.default",
+                data_context=data_context_path,
+            )
+        assert data_context_class_mock.call_count == 1
+
+        # Changing the configuration invalidates the loaded context
+        config_path = os.path.join(data_context_path, "great_expectations.yml")
+        config_mtime = os.path.getmtime(config_path)
+        os.utime(config_path, (config_mtime + 1, config_mtime + 1))
+        ge.validate(
+            dataset,
+            expectation_suite_name="my_dag_node.default",
+            data_context=data_context_path,
+        )
+        assert data_context_class_mock.call_count == 2
+
+
 def test_validate_invalid_parameters(
     dataset, basic_expectation_suite, data_context_parameterized_expectation_suite
 ):
@@ -331,3 +364,180 @@ def test_filter_properties_dict():
     d5_end = copy.deepcopy(d5_begin)
     d5_end_expected = {"c": "xyz_0", "d": 1}
     assert d5_end == d5_end_expected
+
+
+def test_from_pandas_initializes_expectations_once():
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    initialize_expectations = ge.dataset.PandasDataset._initialize_expectations
+    with mock.patch.object(
+        ge.dataset.PandasDataset,
+        "_initialize_expectations",
+        autospec=True,
+        side_effect=initialize_expectations,
+    ) as initialize:
+        profiled = ge.from_pandas(df, profiler=ColumnsExistProfiler)
+        assert initialize.call_count == 1
+        assert [
+            expectation.kwargs["column"]
+            for expectation in profiled.get_expectation_suite().expectations
+        ] == ["a", "b"]
+
+        validated = ge.from_pandas(
+            df,
+            expectation_suite=profiled.get_expectation_suite(),
+        )
+        assert initialize.call_count == 2
+    assert validated.validate().success is True
+
+
+def test_validate_chunked(tmp_path):
+    csv_path = str(tmp_path / "chunked.csv")
+    pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": ["x", "y", "x", None, "y"]}).to_csv(
+        csv_path, index=False
+    )
+    expectation_suite_config = {
+        "expectation_suite_name": "chunked",
+        "expectations": [
+            {
+                "expectation_type": "expect_column_values_to_not_be_null",
+                "kwargs": {"column": "b"},
+            },
+            {
+                "expectation_type": "expect_column_values_to_be_between",
+                "kwargs": {"column": "a", "min_value": 1, "max_value": 5},
+            },
+        ],
+    }
+    results = ge.validate_chunked(
+        csv_path, expectation_suite_config, chunksize=2, max_workers=2
+    )
+    assert [res.success for res in results] == [True, False, True]
+    assert all(res.statistics["evaluated_expectations"] == 2 for res in results)
+    assert results[1].results[0].result["unexpected_count"] == 1
+
+
+def test_validate_dataframe_keeps_columns_outside_expectation_kwargs():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 6, 8], "c": ["x", "y", "z"]})
+    expectation_suite_config = {
+        "expectation_suite_name": "all_columns",
+        "expectations": [
+            {
+                "expectation_type": "expect_column_to_exist",
+                "kwargs": {"column": "b", "column_index": 1},
+            },
+            {
+                "expectation_type": "expect_column_values_to_be_between",
+                "kwargs": {
+                    "column": "a",
+                    "min_value": 2,
+                    "row_condition": "b>5",
+                    "condition_parser": "pandas",
+                },
+            },
+        ],
+    }
+    res = ge.validate(
+        df, expectation_suite_config, data_asset_class=ge.dataset.PandasDataset
+    )
+    assert res.success is True
+
+
+def test_from_pandas_with_narrow_from_dataset_override():
+    class NarrowPandasDataset(ge.dataset.PandasDataset):
+        @classmethod
+        def from_dataset(cls, dataset=None):
+            return cls(dataset)
+
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    profiled = ge.from_pandas(
+        df, dataset_class=NarrowPandasDataset, profiler=ColumnsExistProfiler
+    )
+    assert isinstance(profiled, NarrowPandasDataset)
+    assert [
+        expectation.kwargs["column"]
+        for expectation in profiled.get_expectation_suite().expectations
+    ] == ["a", "b"]
+
+    validated = ge.from_pandas(
+        df,
+        dataset_class=NarrowPandasDataset,
+        expectation_suite=profiled.get_expectation_suite(),
+    )
+    assert isinstance(validated, NarrowPandasDataset)
+    assert len(validated.get_expectation_suite().expectations) == 2
+    assert validated.validate().success is True
+
+
+def test_validate_reuses_loaded_expectation_suite_config():
+    expectation_suite_config = {
+        "expectation_suite_name": "reused_config",
+        "expectations": [
+            {
+                "expectation_type": "expect_column_values_to_not_be_null",
+                "kwargs": {"column": "a"},
+            }
+        ],
+    }
+    with mock.patch(
+        "great_expectations.util.expectationSuiteSchema.loads",
+        wraps=expectationSuiteSchema.loads,
+    ) as loads:
+        for values in [[1, 2], [1, None]]:
+            res = ge.validate(
+                pd.DataFrame({"a": values}),
+                copy.deepcopy(expectation_suite_config),
+                data_asset_class=ge.dataset.PandasDataset,
+            )
+            assert res.success is (None not in values)
+    assert loads.call_count == 1
+
+
+@pytest.fixture
+def json_suite_config():
+    return {
+        "expectation_suite_name": "données_générales",
+        "expectations": [
+            {
+                "expectation_type": "expect_column_mean_to_be_between",
+                "kwargs": {
+                    "column": "température",
+                    "min_value": 0.1,
+                    "max_value": 1e-7,
+                },
+                "meta": {"notes": "mesurée à 20.5°C — ±0.25"},
+            }
+        ],
+        "meta": {"great_expectations_version": "0.13.0", "ratio": 2.5e300},
+    }
+
+
+def test_load_and_dump_json_with_stdlib_json(monkeypatch, json_suite_config):
+    monkeypatch.setattr(ge.util, "orjson", None)
+
+    json_str = ge.util._dump_json(json_suite_config)
+    assert isinstance(json_str, str)
+    # The json module escapes non-ASCII characters
+    assert "\\u00e9" in json_str
+    assert ge.util._load_json(json_str.encode("utf-8")) == json_suite_config
+
+
+def test_load_and_dump_json_with_orjson(monkeypatch, json_suite_config):
+    orjson = pytest.importorskip("orjson")
+    monkeypatch.setattr(ge.util, "orjson", orjson)
+
+    # orjson.dumps returns bytes, which _dump_json decodes
+    json_str = ge.util._dump_json(json_suite_config)
+    assert isinstance(json_str, str)
+    assert "é" in json_str
+    loaded = ge.util._load_json(json_str.encode("utf-8"))
+    assert loaded == json_suite_config
+
+    # Both implementations produce the same object from each other's output
+    monkeypatch.setattr(ge.util, "orjson", None)
+    assert ge.util._load_json(json_str.encode("utf-8")) == loaded
+    stdlib_json_str = ge.util._dump_json(json_suite_config)
+    monkeypatch.setattr(ge.util, "orjson", orjson)
+    assert ge.util._load_json(stdlib_json_str.encode("utf-8")) == loaded
+
+    # Documents that orjson rejects, such as ones containing NaN, are parsed by the json module
+    assert pd.isna(ge.util._load_json(b'{"value": NaN}')["value"])
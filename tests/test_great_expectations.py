@@ -1,6 +1,7 @@
 import os
 import random
 import re
+import tempfile
 import unittest
 
 import pandas as pd
@@ -25,6 +26,7 @@ from great_expectations.data_asset.data_asset import (
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.dataset import MetaPandasDataset, PandasDataset
 from great_expectations.exceptions import InvalidCacheValueError
+from great_expectations.util import is_library_loadable
 
 try:
     from unittest import mock
@@ -997,6 +999,148 @@ class TestIO(unittest.TestCase):
             script_path + "/test_sets/Titanic.csv",
         )
 
+    def test_read_csv_memory_map(self):
+        script_path = os.path.dirname(os.path.realpath(__file__))
+        with mock.patch("pandas.read_csv", wraps=pd.read_csv) as read_csv:
+            df = ge.read_csv(script_path + "/test_sets/Titanic.csv")
+            assert read_csv.call_args[1]["memory_map"] is True
+
+            ge.read_csv(script_path + "/test_sets/Titanic.csv", memory_map=False)
+            assert read_csv.call_args[1]["memory_map"] is False
+        assert df["Name"][0] == "Allen, Miss Elisabeth Walton"
+
+    def test_read_csv_python_engine_is_not_memory_mapped(self):
+        script_path = os.path.dirname(os.path.realpath(__file__))
+        with mock.patch("pandas.read_csv", wraps=pd.read_csv) as read_csv:
+            # The python engine, which sniffs the separator when sep=None, fails on memory-mapped files
+            df = ge.read_csv(script_path + "/test_sets/Titanic.csv", sep=None)
+            assert "memory_map" not in read_csv.call_args[1]
+            assert len(df) == 1313
+
+            df = ge.read_csv(
+                script_path + "/test_sets/Titanic.csv", sep=None, engine="python"
+            )
+            assert "memory_map" not in read_csv.call_args[1]
+            assert len(df) == 1313
+
+    def test_read_csv_prune_columns(self):
+        script_path = os.path.dirname(os.path.realpath(__file__))
+        df = ge.read_csv(script_path + "/test_sets/Titanic.csv")
+        df.expect_column_values_to_not_be_null("Name")
+        df.expect_column_pair_values_A_to_be_greater_than_B("Age", "SexCode")
+        suite = df.get_expectation_suite(discard_failed_expectations=False)
+
+        pruned = ge.read_csv(
+            script_path + "/test_sets/Titanic.csv",
+            expectation_suite=suite,
+            prune_columns=True,
+        )
+        assert list(pruned.columns) == ["Name", "Age", "SexCode"]
+        assert pruned.validate().success == df.validate().success
+
+        df.expect_table_row_count_to_equal(1313)
+        unpruned = ge.read_csv(
+            script_path + "/test_sets/Titanic.csv",
+            expectation_suite=df.get_expectation_suite(
+                discard_failed_expectations=False
+            ),
+            prune_columns=True,
+        )
+        assert list(unpruned.columns) == list(df.columns)
+
+    def _assert_read_csv_does_not_prune_columns(self, df):
+        script_path = os.path.dirname(os.path.realpath(__file__))
+        suite = df.get_expectation_suite(discard_failed_expectations=False)
+        unpruned = ge.read_csv(
+            script_path + "/test_sets/Titanic.csv",
+            expectation_suite=suite,
+            prune_columns=True,
+        )
+        assert list(unpruned.columns) == list(df.columns)
+        res = unpruned.validate()
+        assert res.success is True
+
+    def test_read_csv_prune_columns_keeps_row_condition_columns(self):
+        script_path = os.path.dirname(os.path.realpath(__file__))
+        df = ge.read_csv(script_path + "/test_sets/Titanic.csv")
+        df.expect_column_values_to_be_in_set(
+            "SexCode",
+            [1],
+            row_condition='Sex=="female"',
+            condition_parser="pandas",
+        )
+        self._assert_read_csv_does_not_prune_columns(df)
+
+    def test_read_csv_prune_columns_keeps_columns_for_column_index(self):
+        script_path = os.path.dirname(os.path.realpath(__file__))
+        df = ge.read_csv(script_path + "/test_sets/Titanic.csv")
+        df.expect_column_to_exist("Age", column_index=3)
+        self._assert_read_csv_does_not_prune_columns(df)
+
+    def test_read_csv_prune_columns_keeps_columns_for_table_expectations(self):
+        script_path = os.path.dirname(os.path.realpath(__file__))
+        df = ge.read_csv(script_path + "/test_sets/Titanic.csv")
+        df.expect_table_columns_to_match_ordered_list(["Name", "Age"])
+        suite = df.get_expectation_suite(discard_failed_expectations=False)
+
+        for read, filename in [
+            (ge.read_csv, "Titanic.csv"),
+            (ge.read_parquet, "Titanic.parquet"),
+        ]:
+            unpruned = read(
+                script_path + "/test_sets/" + filename,
+                expectation_suite=suite,
+                prune_columns=True,
+            )
+            full = read(script_path + "/test_sets/" + filename)
+            assert list(unpruned.columns) == list(full.columns)
+            assert unpruned.validate().success is False
+
+    def test_read_csv_prune_columns_skips_missing_columns(self):
+        script_path = os.path.dirname(os.path.realpath(__file__))
+        df = ge.read_csv(script_path + "/test_sets/Titanic.csv")
+        df.expect_column_values_to_not_be_null("Name")
+        df.expect_column_to_exist("zzz")
+        suite = df.get_expectation_suite(discard_failed_expectations=False)
+
+        engines = ["c"]
+        if is_library_loadable(library_name="pyarrow"):
+            engines.append("pyarrow")
+        for engine in engines:
+            pruned = ge.read_csv(
+                script_path + "/test_sets/Titanic.csv",
+                expectation_suite=suite,
+                prune_columns=True,
+                engine=engine,
+            )
+            assert list(pruned.columns) == ["Name"]
+            assert pruned.validate().success is False
+
+    def test_read_csv_pyarrow_engine(self):
+        if not is_library_loadable(library_name="pyarrow"):
+            self.skipTest("pyarrow is not installed")
+        script_path = os.path.dirname(os.path.realpath(__file__))
+        df = ge.read_csv(script_path + "/test_sets/Titanic.csv", engine="pyarrow")
+        assert isinstance(df, PandasDataset)
+        assert df["Name"][0] == "Allen, Miss Elisabeth Walton"
+        assert len(df) == 1313
+
+        df = ge.read_csv(
+            script_path + "/test_sets/Titanic.csv",
+            engine="pyarrow",
+            usecols=["Name", "Age"],
+        )
+        assert list(df.columns) == ["Name", "Age"]
+
+    def test_read_csv_chunksize(self):
+        script_path = os.path.dirname(os.path.realpath(__file__))
+        chunks = list(
+            ge.read_csv(script_path + "/test_sets/Titanic.csv", chunksize=500)
+        )
+        assert [len(chunk) for chunk in chunks] == [500, 500, 313]
+        assert all(isinstance(chunk, PandasDataset) for chunk in chunks)
+        assert chunks[0]["Name"][0] == "Allen, Miss Elisabeth Walton"
+
     def test_read_json(self):
         script_path = os.path.dirname(os.path.realpath(__file__))
         df = ge.read_json(
@@ -1039,12 +1183,29 @@ class TestIO(unittest.TestCase):
         assert isinstance(dfs_dict["Titanic_1"], PandasDataset)
         assert dfs_dict["Titanic_1"]["Name"][0] == "Allen, Miss Elisabeth Walton"
 
+    def test_read_excel_converts_each_worksheet(self):
+        sheets = {
+            "Sheet{}".format(i): pd.DataFrame({"x": list(range(i + 1))})
+            for i in range(4)
+        }
+        with mock.patch("pandas.read_excel", return_value=dict(sheets)):
+            dfs_dict = ge.read_excel("workbook.xlsx", sheet_name=None)
+        assert list(dfs_dict.keys()) == list(sheets.keys())
+        for key, df in dfs_dict.items():
+            assert isinstance(df, PandasDataset)
+            assert df.equals(sheets[key])
+
     def test_read_table(self):
         script_path = os.path.dirname(os.path.realpath(__file__))
         df = ge.read_table(script_path + "/test_sets/Titanic.csv", sep=",")
         assert df["Name"][0] == "Allen, Miss Elisabeth Walton"
         assert isinstance(df, PandasDataset)
 
+        chunks = ge.read_table(
+            script_path + "/test_sets/Titanic.csv", sep=",", chunksize=1000
+        )
+        assert [len(chunk) for chunk in chunks] == [1000, 313]
+
     def test_read_feather(self):
         pandas_version = re.match(r"(\d+)\.(\d+)\..+", pd.__version__)
         if pandas_version is None:
@@ -1083,10 +1244,70 @@ class TestIO(unittest.TestCase):
                 pytest.skip("Pandas version < 23 is no longer compatible with pyarrow")
 
         script_path = os.path.dirname(os.path.realpath(__file__))
-        df = ge.read_parquet(script_path + "/test_sets/Titanic.parquet")
+        with mock.patch("pandas.read_parquet", wraps=pd.read_parquet) as read_parquet:
+            df = ge.read_parquet(script_path + "/test_sets/Titanic.parquet")
+            # Local files are opened by ge.read_parquet rather than by pandas
+            assert hasattr(read_parquet.call_args[0][0], "read")
         assert df["Name"][1] == "Allen, Miss Elisabeth Walton"
         assert isinstance(df, PandasDataset)
 
+    def test_read_parquet_partitioned_directory(self):
+        if not is_library_loadable(library_name="pyarrow.dataset"):
+            self.skipTest("pyarrow.dataset is not available")
+        import pyarrow.dataset
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pd.DataFrame(
+                {"year": [2019, 2019, 2020], "value": [1, 2, 3], "name": list("abc")}
+            ).to_parquet(tmp_dir, partition_cols=["year"])
+
+            df = ge.read_parquet(tmp_dir)
+            assert isinstance(df, PandasDataset)
+            # Partition columns come back as categoricals, as with pandas.read_parquet
+            pd.testing.assert_frame_equal(df, pd.read_parquet(tmp_dir))
+            assert df["year"].dtype.name == "category"
+
+            df = ge.read_parquet(
+                tmp_dir,
+                columns=["value", "year"],
+                filter=pyarrow.dataset.field("year") == 2020,
+            )
+            assert list(df.columns) == ["value", "year"]
+            assert df["value"].tolist() == [3]
+            assert df["year"].tolist() == [2020]
+
+        script_path = os.path.dirname(os.path.realpath(__file__))
+        df = ge.read_parquet(
+            script_path + "/test_sets/Titanic.parquet",
+            filter=pyarrow.dataset.field("Age") > 70,
+        )
+        assert len(df) > 0
+        assert (df["Age"] > 70).all()
+
+        with pytest.raises(ValueError, match="filter requires"):
+            ge.read_parquet(
+                script_path + "/test_sets/Titanic.parquet",
+                filter=pyarrow.dataset.field("Age") > 70,
+                use_threads=False,
+            )
+
+    def test_read_parquet_prune_columns_skips_missing_columns(self):
+        if not is_library_loadable(library_name="pyarrow.dataset"):
+            self.skipTest("pyarrow.dataset is not available")
+        script_path = os.path.dirname(os.path.realpath(__file__))
+        df = ge.read_parquet(script_path + "/test_sets/Titanic.parquet")
+        df.expect_column_values_to_not_be_null("Name")
+        df.expect_column_to_exist("zzz")
+        suite = df.get_expectation_suite(discard_failed_expectations=False)
+
+        pruned = ge.read_parquet(
+            script_path + "/test_sets/Titanic.parquet",
+            expectation_suite=suite,
+            prune_columns=True,
+        )
+        assert list(pruned.columns) == ["Name"]
+        assert pruned.validate().success is False
+
     def test_read_pickle(self):
         script_path = os.path.dirname(os.path.realpath(__file__))
         df = ge.read_pickle(